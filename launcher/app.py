@@ -63,6 +63,10 @@ class LauncherApp:
             logger.error(f"Fatal error: {e}", exc_info=True)
             raise
         finally:
+            # Finish queued saves, then fold any journaled edits back
+            # into shortcuts.json
+            config_manager.flush_saves()
+            config_manager.compact_journal()
             logger.info("Application closed")
 
 
@@ -0,0 +1,174 @@
+# bench.py
+"""Micro-benchmarks for the big-tree work.
+
+Not a test suite - just numbers to check a change against:
+    python3 launcher/bench.py models --items 50000
+    python3 launcher/bench.py widgets --tiles 300   (needs a display)
+"""
+
+import json
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from dataclasses import dataclass, field
+from typing import Dict
+
+from models import Folder, Shortcut, item_from_dict
+
+
+def make_tree(total: int, per_folder: int = 200) -> dict:
+    """A shortcuts.json-shaped dict like the scan_for_* scripts build:
+    flat folders of exe shortcuts with single-letter icons."""
+    tree = {}
+    for start in range(0, total, per_folder):
+        items = {}
+        for n in range(start, min(start + per_folder, total)):
+            name = f"Program {n:06d}"
+            items[name] = {"type": "shortcut", "icon": name[0],
+                           "path": f"/mnt/games/dir{n // per_folder}/prog{n}.exe",
+                           "args": ""}
+        tree[f"Apps {start // per_folder}"] = {"type": "folder", "icon": "A",
+                                               "items": items}
+    # Round-trip so strings are fresh objects, as after a json.load
+    return json.loads(json.dumps(tree))
+
+
+# The pre-1.4 model layout, kept here only as the baseline to beat
+@dataclass
+class _DictItem:
+    name: str
+    icon: str
+    type: str = ""
+
+
+@dataclass
+class _DictShortcut(_DictItem):
+    path: str = ""
+    args: str = ""
+
+
+@dataclass
+class _DictFolder(_DictItem):
+    items: Dict[str, _DictItem] = field(default_factory=dict)
+
+
+def _dict_item_from_dict(name, data):
+    if data.get('type', 'shortcut') == 'folder':
+        folder = _DictFolder(name=name, icon=data.get('icon', name[0].upper()),
+                             type='folder')
+        for child_name, child_data in data.get('items', {}).items():
+            folder.items[child_name] = _dict_item_from_dict(child_name, child_data)
+        return folder
+    return _DictShortcut(name=name, icon=data.get('icon', name[0].upper()),
+                         type='shortcut', path=data.get('path', ''),
+                         args=data.get('args', ''))
+
+
+def _item_from_dict_eager(name, data):
+    """item_from_dict, then open every folder - the whole-tree cost."""
+    item = item_from_dict(name, data)
+    stack = [item]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Folder):
+            stack.extend(node.items.values())
+    return item
+
+
+def _measure(build, data, repeat: int = 3):
+    """(best seconds, bytes) to turn the raw dict into a model tree.
+
+    Timed runs and the traced run are separate - tracemalloc slows
+    allocation down enough to swamp the timing."""
+    elapsed = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tree = {name: build(name, item) for name, item in data.items()}
+        elapsed = min(elapsed, time.perf_counter() - start)
+        del tree
+    tracemalloc.start()
+    tree = {name: build(name, item) for name, item in data.items()}
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return elapsed, size
+
+
+def bench_models(items: int):
+    data = make_tree(items)
+    print(f"Model tree for {items} shortcuts:")
+    results = {}
+    for label, build in (("dataclass (old)", _dict_item_from_dict),
+                         ("slotted, all open", _item_from_dict_eager),
+                         ("lazy, unopened", item_from_dict)):
+        elapsed, size = _measure(build, data)
+        results[label] = size
+        print(f"  {label:<18} {elapsed * 1000:8.1f} ms  "
+              f"{size / 1024 / 1024:7.2f} MiB  {size / items:6.0f} B/item")
+    old, new = results["dataclass (old)"], results["slotted, all open"]
+    print(f"  saving with every folder open: {(old - new) / old:.0%}")
+
+
+def bench_widgets(tiles: int, rounds: int = 5):
+    """Tiles per second: building fresh IconWidgets vs rebinding pooled ones.
+
+    Mirrors what render_items() does on each folder change."""
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"widgets benchmark needs a display: {e}")
+        return
+    root.withdraw()
+    from ui.widgets import IconWidget  # needs a Tk root for its fonts
+
+    frame = tk.Frame(root)
+    frame.pack()
+    # Alternate between two sets so every rebind really changes the tile
+    sets = [[Shortcut(f"App {n} {i}", chr(65 + i % 26)) for i in range(tiles)]
+            for n in range(2)]
+
+    def grid(widget, index):
+        row, col = divmod(index, 9)
+        widget.grid(row=row, column=col, padx=10, pady=10, sticky='n')
+
+    start = time.perf_counter()
+    for r in range(rounds):
+        for widget in frame.winfo_children():
+            widget.destroy()
+        for index, item in enumerate(sets[r % 2]):
+            grid(IconWidget(frame, item), index)
+        root.update_idletasks()
+    fresh = time.perf_counter() - start
+
+    pool = list(frame.winfo_children())
+    start = time.perf_counter()
+    for r in range(rounds):
+        for index, item in enumerate(sets[(r + 1) % 2]):
+            pool[index].set_item(item)
+            grid(pool[index], index)
+        root.update_idletasks()
+    pooled = time.perf_counter() - start
+    root.destroy()
+
+    total = tiles * rounds
+    print(f"{tiles} tiles x {rounds} renders:")
+    print(f"  {'fresh widgets':<16} {total / fresh:10.0f} tiles/s")
+    print(f"  {'pooled rebind':<16} {total / pooled:10.0f} tiles/s  "
+          f"({fresh / pooled:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Magic Launcher micro-benchmarks")
+    sub = parser.add_subparsers(dest="bench", required=True)
+    models = sub.add_parser("models", help="model tree memory and build time")
+    models.add_argument("--items", type=int, default=50000)
+    widgets = sub.add_parser("widgets", help="icon tiles built per second")
+    widgets.add_argument("--tiles", type=int, default=300)
+    widgets.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.bench == "models":
+        bench_models(args.items)
+    elif args.bench == "widgets":
+        bench_widgets(args.tiles, args.rounds)
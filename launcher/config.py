@@ -1,12 +1,18 @@
 """Configuration management for launcher."""
 
 import json
-from typing import Dict, Any
+import os
+import queue
+import threading
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
-from constants import CONFIG_FILE, CONFIG_DIR, DEFAULT_SHORTCUTS_PATH, SETTINGS_FILE, APP_NAME_PATH
+from constants import (CONFIG_FILE, CONFIG_DIR, DEFAULT_SHORTCUTS_PATH, SETTINGS_FILE,
+                       APP_NAME_PATH, JOURNAL_FILE, JOURNAL_COMPACT_OPS)
 from models import item_from_dict, BaseItem, Folder
+from utils.journal import append_ops, apply_ops, read_journal
 from utils.logger import logger
+from utils.snapshot import load_config, write_snapshot
 
 
 class ConfigManager:
@@ -16,6 +22,21 @@ class ConfigManager:
         self.shortcuts = {}
         self.settings = {}
         self.ensure_directories()
+        self.load_settings()
+
+        # Journaled saves: edits append to JOURNAL_FILE, compaction folds
+        # them back into CONFIG_FILE. The lock serializes appends, full
+        # saves and compaction against each other.
+        self._journal_lock = threading.Lock()
+        self._journal_ops = 0
+        self._compacting = False
+
+        # Background writer for save_shortcuts_async(): one thread, so saves
+        # land in the order they were made. Failed saves are reported on
+        # save_errors for the UI to pick up on its own thread.
+        self._save_queue: queue.Queue = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self.save_errors: queue.Queue = queue.Queue()
 
     def get_app_name(self) -> str:
         """Get the application name from the config file."""
@@ -38,11 +59,22 @@ class ConfigManager:
     
     def load_shortcuts(self) -> Dict[str, BaseItem]:
         """Load shortcuts from config file."""
+        self.flush_saves()  # queued saves first, or we'd read stale files
         if CONFIG_FILE.exists():
             try:
-                with open(CONFIG_FILE, 'r') as f:
-                    data = json.load(f)
-                
+                # Compiled snapshot when current, else JSON (and refresh
+                # it), plus the edits not yet compacted into it. Both are
+                # read under the lock: a background compaction between
+                # its write and its journal delete would have us replay
+                # edits the JSON already has.
+                with self._journal_lock:
+                    data = load_config(CONFIG_FILE, refresh=True)
+                    ops = read_journal(JOURNAL_FILE)
+                    self._journal_ops = len(ops)
+                if ops:
+                    apply_ops(data, ops)
+                    logger.info(f"Replayed {len(ops)} journaled edits")
+
                 # Convert to model objects
                 shortcuts = {}
                 for name, item_data in data.items():
@@ -59,24 +91,146 @@ class ConfigManager:
             logger.info("No config file found, using defaults")
             return self._get_default_shortcuts()
     
-    def save_shortcuts(self, shortcuts: Dict[str, BaseItem]):
-        """Save shortcuts to config file."""
+    def save_shortcuts(self, shortcuts: Dict[str, BaseItem],
+                       ops: Optional[List[dict]] = None):
+        """Save shortcuts to config file.
+
+        With journaled saves on and the edit described as journal ops
+        (see utils/journal.py), only the ops are appended; the full
+        rewrite happens in a background compaction every
+        JOURNAL_COMPACT_OPS edits. Otherwise the whole tree is written.
+        """
+        if ops and self.settings.get('journal_saves') and self._append_journal(ops):
+            return True
+        return self._save_data(self._tree_data(shortcuts))
+
+    def save_shortcuts_async(self, shortcuts: Dict[str, BaseItem],
+                             ops: Optional[List[dict]] = None):
+        """Queue a save for the background writer and return at once.
+
+        Same result as save_shortcuts(). The tree is turned into plain
+        dicts here, on the caller's thread, so the writer never reads
+        models the UI is still editing; with journaled saves only the ops
+        are queued. Failures end up on save_errors."""
+        if ops and self.settings.get('journal_saves'):
+            job = (ops, None)
+        else:
+            job = (None, self._tree_data(shortcuts))
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop,
+                                            name='config-writer', daemon=True)
+            self._writer.start()
+        self._save_queue.put(job)
+
+    def pending_saves(self) -> int:
+        """Saves queued or still being written."""
+        return self._save_queue.unfinished_tasks
+
+    def flush_saves(self):
+        """Block until every queued save has been written."""
+        if self._writer is not None:
+            self._save_queue.join()
+
+    def _write_loop(self):
+        while True:
+            ops, data = self._save_queue.get()
+            try:
+                if ops is not None:
+                    if not self._append_journal(ops):
+                        # Can't see the live tree from here; rebuild it
+                        # from the files plus this edit instead
+                        data = self._disk_data()
+                        apply_ops(data, ops)
+                if data is not None and not self._save_data(data):
+                    self.save_errors.put(f"Could not save {CONFIG_FILE} - see launcher.log")
+            except Exception as e:
+                logger.error(f"Error in background save: {e}")
+                self.save_errors.put(f"Could not save {CONFIG_FILE}: {e}")
+            finally:
+                self._save_queue.task_done()
+
+    def _tree_data(self, shortcuts: Dict[str, BaseItem]) -> Dict[str, Any]:
+        """Convert models to dict"""
+        return {name: item.to_dict() for name, item in shortcuts.items()}
+
+    def _disk_data(self) -> Dict[str, Any]:
+        """shortcuts.json as raw dicts, with any journaled edits replayed."""
+        with self._journal_lock:
+            return apply_ops(load_config(CONFIG_FILE), read_journal(JOURNAL_FILE))
+
+    def _append_journal(self, ops: List[dict]) -> bool:
+        """Journal an edit; False if that failed and a full save is needed."""
         try:
-            # Convert models to dict
-            data = {
-                name: item.to_dict() 
-                for name, item in shortcuts.items()
-            }
-            
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
-            
-            logger.info(f"Saved {len(shortcuts)} items to config")
+            with self._journal_lock:
+                append_ops(JOURNAL_FILE, ops)
+                self._journal_ops += len(ops)
+                due = self._journal_ops >= JOURNAL_COMPACT_OPS
+            logger.info(f"Journaled {len(ops)} edit(s)")
+            if due:
+                self.compact_journal(background=True)
+            return True
+        except Exception as e:
+            logger.error(f"Error journaling edit, saving in full: {e}")
+            return False
+
+    def _save_data(self, data: Dict[str, Any]) -> bool:
+        """Write a full tree of raw dicts; False (logged) on failure."""
+        try:
+            with self._journal_lock:
+                self._write_config(data)
+                # The full tree already includes anything journaled
+                self._discard_journal()
+
+            logger.info(f"Saved {len(data)} items to config")
             return True
             
         except Exception as e:
             logger.error(f"Error saving config: {e}")
             return False
+
+    def _write_config(self, data: Dict[str, Any]):
+        """Atomically replace CONFIG_FILE (temp file + os.replace), so a
+        crash mid-write leaves the old config intact, then refresh the
+        snapshot."""
+        tmp = CONFIG_FILE.with_name(CONFIG_FILE.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, CONFIG_FILE)
+        write_snapshot(CONFIG_FILE, data)
+
+    def _discard_journal(self):
+        try:
+            JOURNAL_FILE.unlink()
+        except FileNotFoundError:
+            pass
+        self._journal_ops = 0
+
+    def compact_journal(self, background: bool = False):
+        """Fold pending journal ops into shortcuts.json and drop the journal.
+
+        Works from the files on disk, not the live tree, so a background
+        compaction never races the UI's edits to the models."""
+        if background:
+            if not self._compacting:
+                self._compacting = True
+                threading.Thread(target=self.compact_journal,
+                                 name='journal-compact', daemon=True).start()
+            return
+
+        try:
+            with self._journal_lock:
+                ops = read_journal(JOURNAL_FILE)
+                if ops:
+                    data = apply_ops(load_config(CONFIG_FILE), ops)
+                    self._write_config(data)
+                    logger.info(f"Compacted {len(ops)} journaled edits")
+                self._discard_journal()
+        except Exception as e:
+            logger.error(f"Error compacting journal: {e}")
+        finally:
+            self._compacting = False
     
     def load_settings(self) -> Dict[str, Any]:
         """Load user settings."""
@@ -8,18 +8,41 @@ APP_NAME = "Shouldn't see this, use ConfigManager.get_app_name() instead"
 # Paths
 CONFIG_DIR = Path.home() / '.config' / 'launcher'
 CONFIG_FILE = CONFIG_DIR / 'shortcuts.json'
+JOURNAL_FILE = CONFIG_DIR / 'shortcuts.journal'
 ICONS_DIR = CONFIG_DIR / 'icons'
+ICON_THUMBS_DIR = ICONS_DIR / '.cache'  # pre-scaled icons, see utils/icons.py
 LOG_FILE = CONFIG_DIR / 'launcher.log'
 SETTINGS_FILE = CONFIG_DIR / 'settings.json'
 APP_NAME_PATH = CONFIG_DIR / 'title.txt'
 HOTKEYS_DIR = CONFIG_DIR / 'hotkeys'
 PASSWORD_FILE = CONFIG_DIR / 'password.txt'
 
+# Journaled saves ("journal_saves": true in settings.json) compact the
+# journal back into shortcuts.json after this many edits, and on exit
+JOURNAL_COMPACT_OPS = 50
+
 # UI Constants
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 ICON_SIZE = 80
 ICON_GRID_COLUMNS = 9
+SEARCH_DEBOUNCE_MS = 150  # quiet time after a keystroke before searching
+RESIZE_DEBOUNCE_MS = 120  # quiet time after a window resize before re-gridding
+RENDER_CHUNK = 36  # tiles built per event-loop turn; the rest follow when idle
+TILE_POOL_SPARE = 120  # hidden tiles kept for reuse after a render shrinks the grid
+TILE_CELL_WIDTH = 140  # grid cell: a 120x140 tile plus 10px padding each side
+TILE_CELL_HEIGHT = 160
+GRID_OVERSCAN_ROWS = 2  # rows of tiles kept beyond each edge of the viewport
+VALIDATE_POLL_MS = 50  # how often a tile checks on its background target check
+VALIDATE_TIMEOUT = 5.0  # seconds a tile waits for a target check before giving up
+SERVER_VALIDATE_TIMEOUT = 0.5  # seconds a page waits, in total, for target checks
+SERVER_UNSETTLED_PAGE_TTL = 3.0  # seconds a page rendered with unanswered checks stays cached
+SAVE_POLL_MS = 250  # how often the UI checks the background writer for failed saves
+VIEW_CACHE_SIZE = 8  # folder views kept built for going back ("view_cache_size")
+ICON_CACHE_SIZE = 256  # decoded icon images kept in memory, least recently used dropped
+ICON_PREFETCH_DELAY_MS = 300  # quiet time after a render before prefetching icons
+ICON_PREFETCH_LIMIT = 200  # icons queued per prefetch (current view + subfolders)
+SEARCH_RESULT_LIMIT = 50  # tiles shown by ranked ("search_mode": "fuzzy") search
 LABEL_BASE_WIDTH = 10  # Base width for labels, can be adjusted based on name length
 
 # 16 color CGA/EGA palette
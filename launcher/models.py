@@ -1,16 +1,42 @@
-"""Data models for launcher items."""
+"""Data models for launcher items.
 
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
+Trees generated by the scan_for_* scripts run to tens of thousands of
+entries, so the models are slotted rather than dataclasses: no
+per-instance __dict__, and icon strings are interned so a thousand
+tiles sharing "game.bmp" share one string. The public surface is the
+same as the old dataclasses - keyword/positional construction, field
+equality, a readable repr, to_dict() and item_from_dict().
+
+Folders loaded by item_from_dict are lazy: their children stay as the
+raw JSON dicts until something reads `items`. Startup and server
+requests then pay for the folders actually opened, not the whole tree.
+"""
+
+import sys
+import threading
+from typing import Dict, Any, Iterator, Optional
 
 
-@dataclass
 class BaseItem:
     """Base class for launcher items."""
-    name: str
-    icon: str
-    type: str = ""  # Add default
-    
+
+    __slots__ = ('name', 'icon', 'type')
+    _fields = ('name', 'icon', 'type')
+
+    def __init__(self, name: str, icon: str, type: str = ""):
+        self.name = name
+        self.icon = sys.intern(icon) if icon.__class__ is str else icon
+        self.type = type
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{self.__class__.__name__}({fields})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self._fields)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -19,15 +45,22 @@ class BaseItem:
         }
 
 
-@dataclass
 class Shortcut(BaseItem):
     """A shortcut/launcher item."""
-    path: str = ""  # Add default
-    args: str = ""
-    
-    def __post_init__(self):
+
+    __slots__ = ('path', 'args')
+    _fields = BaseItem._fields + ('path', 'args')
+
+    def __init__(self, name: str, icon: str, type: str = "",
+                 path: str = "", args: str = ""):
+        # Fields assigned inline rather than via super().__init__ - this
+        # runs once per shortcut when loading, so the call adds up
+        self.name = name
+        self.icon = sys.intern(icon) if icon.__class__ is str else icon
         self.type = "shortcut"
-    
+        self.path = path
+        self.args = args
+
     def to_dict(self) -> Dict[str, Any]:
         data = super().to_dict()
         data.update({
@@ -37,53 +70,110 @@ class Shortcut(BaseItem):
         return data
 
 
-@dataclass
 class Folder(BaseItem):
-    """A folder containing other items."""
-    items: Dict[str, 'BaseItem'] = field(default_factory=dict)
-    
-    def __post_init__(self):
+    """A folder containing other items.
+
+    `items` is materialized on first access. Until then the children
+    are held as the raw dicts they were loaded from, and to_dict()
+    hands those straight back - an unopened subtree round-trips through
+    load and save without ever becoming model objects. Raw dicts are
+    never mutated, so copies made via to_dict() may share them.
+    """
+
+    __slots__ = ('_items', '_raw')
+    _fields = BaseItem._fields + ('items',)
+
+    def __init__(self, name: str, icon: str, type: str = "",
+                 items: Optional[Dict[str, BaseItem]] = None):
+        self.name = name
+        self.icon = sys.intern(icon) if icon.__class__ is str else icon
         self.type = "folder"
-    
+        self._items = {} if items is None else items
+        self._raw = None
+
+    @classmethod
+    def lazy(cls, name: str, icon: str, raw_items: Dict[str, Any]) -> 'Folder':
+        """A folder whose children are built from raw_items on first use."""
+        folder = cls(name=name, icon=icon)
+        folder._items = None
+        folder._raw = raw_items
+        return folder
+
+    @property
+    def items(self) -> Dict[str, BaseItem]:
+        items = self._items
+        if items is None:
+            # The server reads one tree from many threads; the lock makes
+            # sure they all see the same materialized children.
+            with _materialize_lock:
+                items = self._items
+                if items is None:
+                    items = {child_name: item_from_dict(child_name, child_data)
+                             for child_name, child_data in self._raw.items()}
+                    self._items = items
+                    self._raw = None
+        return items
+
+    @items.setter
+    def items(self, items: Dict[str, BaseItem]):
+        self._items = items
+        self._raw = None
+
+    def child_icons(self) -> Iterator[str]:
+        """The children's icon specs, without materializing them."""
+        raw = self._raw
+        if raw is not None:
+            return (data.get('icon', '') for data in raw.values())
+        return (item.icon for item in self.items.values())
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the children exist as model objects yet."""
+        return self._items is not None
+
     def to_dict(self) -> Dict[str, Any]:
         data = super().to_dict()
-        data['items'] = {
-            name: item.to_dict() 
-            for name, item in self.items.items()
-        }
+        if self._items is None:
+            data['items'] = self._raw
+        else:
+            data['items'] = {
+                name: item.to_dict()
+                for name, item in self._items.items()
+            }
         return data
-    
+
     def add_item(self, item: BaseItem):
         """Add an item to this folder."""
         self.items[item.name] = item
-    
+
     def remove_item(self, name: str):
         """Remove an item from this folder."""
         if name in self.items:
             del self.items[name]
-    
+
     def get_item(self, name: str) -> Optional[BaseItem]:
         """Get an item by name."""
         return self.items.get(name)
 
 
+_materialize_lock = threading.Lock()
+
+
 def item_from_dict(name: str, data: Dict[str, Any]) -> BaseItem:
     """Create an item from dictionary data."""
     item_type = data.get('type', 'shortcut')
-    
+
     if item_type == 'folder':
-        folder = Folder(
+        # Child items are created when the folder is first opened
+        return Folder.lazy(
             name=name,
-            icon=data.get('icon', name[0].upper())
+            icon=data.get('icon', name[0].upper()),
+            raw_items=data.get('items', {})
         )
-        # Recursively create child items
-        for child_name, child_data in data.get('items', {}).items():
-            folder.add_item(item_from_dict(child_name, child_data))
-        return folder
     else:
         return Shortcut(
             name=name,
             icon=data.get('icon', name[0].upper()),
             path=data.get('path', ''),
             args=data.get('args', '')
-        )
\ No newline at end of file
+        )
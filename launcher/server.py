@@ -4,8 +4,8 @@ Serves the shortcut tree as a tappable tile grid so any browser on the
 LAN (phone, tablet, old laptop) becomes a Stream Deck for this machine.
 
 The native tkinter launcher stays the source of truth: it owns all
-create/edit/delete. This server never writes shortcuts.json - it reads
-the config fresh on every request and launches on tap.
+create/edit/delete. This server never writes shortcuts.json - it re-reads
+the config whenever the file changes on disk and launches on tap.
 
 Security model: the client sends an IDENTIFIER (a path into the tree,
 e.g. "Games/DOSBox"), never a command. The server resolves that id
@@ -26,29 +26,59 @@ what can be launched and what happened, never the commands behind tiles:
     GET  /folder/<id>       tiles inside a folder
     POST /launch  id=<id>   launch by trusted id -> {ok, status}
     GET  /status            latest status per tile
+    GET  /search?q=<text>   ranked fuzzy matches across the whole tree
     GET  /log               recent launch events (in-memory, capped)
 """
 
 import argparse
+import gzip
+import hashlib
+import io
 import json
 import html
+import os
 import threading
 import time
-from collections import deque
+from collections import OrderedDict, deque
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from urllib.parse import quote, unquote, parse_qs, urlparse
 
-from constants import CONFIG_FILE, ICONS_DIR, APP_NAME_PATH, COLORS, VERSION
+from constants import (CONFIG_FILE, JOURNAL_FILE, ICONS_DIR, APP_NAME_PATH, COLORS, VERSION,
+                       SERVER_VALIDATE_TIMEOUT, SERVER_UNSETTLED_PAGE_TTL)
 from models import item_from_dict, BaseItem, Shortcut, Folder
-from utils.launcher import Launcher, is_valid_target, clear_validity_cache
+from utils.launcher import (Launcher, VALIDITY_TTL, check_targets,
+                            start_validity_watcher, validity_generation)
+from utils.journal import apply_ops, read_journal
+from utils.search import SearchIndex
+from utils.snapshot import load_config
+from utils.tree_index import TreeIndex, encode_id, decode_id
 from utils.logger import logger
 
+# Optional, like in the native app: without PIL, icons are served one BMP
+# per tile instead of as a per-folder sprite sheet
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
 DEFAULT_HOST = '127.0.0.1'
 DEFAULT_PORT = 8180
 
 MAX_BODY_BYTES = 64 * 1024
 
+SEARCH_LIMIT = 50  # default and cap for /search results
+
+GZIP_MIN_BYTES = 1024  # smaller bodies aren't worth a gzip header and CPU
+GZIP_LEVEL = 6
+# Already-compressed types (PNG atlases) are sent as they are
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/javascript', 'image/bmp')
+
+# Status and log ETags are built from counters that restart with the
+# server; this keeps a browser's tag from a previous run from matching
+RUN_ID = f'{time.time_ns():x}'
+
 
 def get_app_name() -> str:
     """Read the title bar file the native app uses, without touching config.py
@@ -61,53 +91,118 @@ def get_app_name() -> str:
     return "Magic Launcher"
 
 
-def load_tree() -> dict:
+def _read_tree() -> dict:
     """Fresh-read shortcuts.json into the model tree.
 
     Returns {} on a missing or broken file. Unlike ConfigManager, this
     never falls back to writing defaults - the server does not write.
     """
     try:
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # The launcher's compiled snapshot when current; read-only here
+        data = load_config(CONFIG_FILE)
     except FileNotFoundError:
         logger.warning(f"No config file at {CONFIG_FILE} - serving empty grid")
         return {}
     except (json.JSONDecodeError, OSError) as e:
         logger.error(f"Error reading config: {e}")
         return {}
+    # Edits the native app has journaled but not yet compacted
+    apply_ops(data, read_journal(JOURNAL_FILE))
     return {name: item_from_dict(name, item_data) for name, item_data in data.items()}
 
 
-def decode_id(item_id: str) -> str:
-    """Turn an encoded tree-path id back into a readable path for display."""
-    return '/'.join(unquote(seg) for seg in item_id.split('/'))
+class TreeCache:
+    """The parsed shortcut tree, shared by every request thread.
 
+    Keyed on the config file's (mtime_ns, size, inode), plus the edit
+    journal's: each request costs a couple of os.stat calls, and the
+    JSON is only re-parsed when the native app (or an editor) has
+    actually changed something. An atomic replace changes the inode, an
+    in-place rewrite or a journal append changes mtime/size - either way
+    the next request sees the new tree.
 
-def encode_id(segments) -> str:
-    """Encode a list of item names into a URL-safe tree-path id.
+    The cached tree is read-only by convention: handlers never mutate
+    it, so threads can share it without copying. `version` bumps on
+    every re-parse for anything that wants to cache derived data; the
+    id index is one such thing and is rebuilt alongside the tree.
+    """
 
-    Each segment is fully percent-encoded so names containing '/' can't
-    forge extra path levels."""
-    return '/'.join(quote(seg, safe='') for seg in segments)
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key = None
+        self._index = TreeIndex({})
+        self._search = None  # (version, SearchIndex), built on first search
+        self.version = 0
+
+    def _stat_key(self):
+        key = []
+        for path in (CONFIG_FILE, JOURNAL_FILE):
+            try:
+                st = os.stat(path)
+            except OSError:
+                key.append(None)
+            else:
+                key.append((st.st_mtime_ns, st.st_size, st.st_ino))
+        return tuple(key)
 
+    def index(self) -> TreeIndex:
+        # Stat before reading: if the file changes mid-parse, the stale
+        # key guarantees the next request parses again.
+        key = self._stat_key()
+        with self._lock:
+            if self.version == 0 or key != self._key:
+                self._index = TreeIndex(_read_tree())
+                self._key = key
+                self.version += 1
+                logger.debug(f"Config parsed (tree version {self.version})")
+            return self._index
+
+    def snapshot(self) -> tuple:
+        """(version, index) from the same parse, for keying derived data."""
+        index = self.index()
+        with self._lock:
+            if index is self._index:
+                return self.version, index
+        return self.snapshot()  # re-parsed in between; try again
 
-def resolve(tree: dict, item_id: str):
-    """Walk the trusted tree to the item named by an encoded id.
+    def get(self) -> dict:
+        return self.index().tree
 
-    Returns the BaseItem, or None if any segment doesn't resolve."""
-    if not item_id:
-        return None
-    item = None
-    items = tree
-    for seg in item_id.split('/'):
-        if not isinstance(items, dict):
-            return None
-        item = items.get(unquote(seg))
-        if item is None:
-            return None
-        items = item.items if isinstance(item, Folder) else None
-    return item
+    def search_index(self) -> SearchIndex:
+        """The search index for the current version, built on first use."""
+        index = self.index()
+        with self._lock:
+            if self._search is None or self._search[0] != self.version:
+                self._search = (self.version, SearchIndex(index.tree))
+            return self._search[1]
+
+
+tree_cache = TreeCache()
+
+
+def load_tree() -> dict:
+    """The current model tree - parsed once, re-parsed only on change.
+
+    Returns {} on a missing or broken file. Unlike ConfigManager, this
+    never falls back to writing defaults - the server does not write.
+    """
+    return tree_cache.get()
+
+
+def load_index() -> TreeIndex:
+    """The id index of the current tree (one per tree version).
+
+    Use index.tree rather than a separate load_tree() call when both
+    are needed, so the two always come from the same version."""
+    return tree_cache.index()
+
+
+def resolve(item_id: str):
+    """Look up an encoded id in the trusted tree's index.
+
+    Returns the index Entry (item, parent, canonical path and id), or
+    None if the id doesn't resolve."""
+    return load_index().resolve_id(item_id)
 
 
 # --- Launch tracking (the per-tile status dots) ---
@@ -118,23 +213,30 @@ class LaunchTracker:
     Status per tile: 'running' while the process is alive, then 'ok'
     (exit 0) or 'fail' (nonzero exit, or the launch never spawned).
     Transitions are also appended to an in-memory event log, capped so
-    the server can't grow without bound.
+    the server can't grow without bound. `version` bumps with every
+    transition, for keying anything rendered from the statuses.
     """
 
     def __init__(self, history: int = 200):
         self._lock = threading.Lock()
         self._latest = {}  # canonical item id -> launch record
         self.events = deque(maxlen=history)  # (timestamp, id, status)
+        self.version = 0
 
     def start(self, item_id: str, proc) -> str:
         status = 'running' if proc is not None else 'fail'
         with self._lock:
             self._latest[item_id] = {'proc': proc, 'status': status}
             self.events.append((time.time(), item_id, status))
+            self.version += 1
         return status
 
     def statuses(self) -> dict:
         """Current status per tile, polling any still-running processes."""
+        return self.snapshot()[1]
+
+    def snapshot(self) -> tuple:
+        """(version, statuses) as of one moment."""
         with self._lock:
             for item_id, rec in self._latest.items():
                 if rec['status'] != 'running':
@@ -143,8 +245,9 @@ class LaunchTracker:
                 if code is not None:
                     rec['status'] = 'ok' if code == 0 else 'fail'
                     self.events.append((time.time(), item_id, rec['status']))
-            return {item_id: rec['status']
-                    for item_id, rec in self._latest.items()}
+                    self.version += 1
+            return self.version, {item_id: rec['status']
+                                  for item_id, rec in self._latest.items()}
 
     def log(self) -> list:
         """Chronological copy of the event log (oldest first)."""
@@ -156,6 +259,183 @@ class LaunchTracker:
 tracker = LaunchTracker()
 
 
+# --- Rendered page cache ---
+
+class CachedPage:
+    """One rendered response body and its strong ETag (a hash of it).
+
+    The gzipped body is made on the first request that accepts it and
+    kept alongside, so a page is compressed once per version. ttl is how
+    long PageCache serves it."""
+
+    __slots__ = ('content_type', 'body', 'etag', 'created', 'ttl', 'atlas', '_gzipped')
+
+    def __init__(self, content_type: str, body: bytes, atlas: tuple = None,
+                 ttl: float = VALIDITY_TTL):
+        self.content_type = content_type
+        self.body = body
+        self.etag = hashlib.sha1(body).hexdigest()[:20]
+        self.created = time.monotonic()
+        self.ttl = ttl
+        self.atlas = atlas  # (id, icon names) of the sprite sheet it links
+        self._gzipped = None
+
+    def gzipped(self) -> bytes:
+        # Two threads may both compress a new page; either result will do
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, GZIP_LEVEL)
+        return self._gzipped
+
+
+class PageCache:
+    """Rendered folder pages and JSON listings, shared by request threads.
+
+    Keyed by everything a page is rendered from - folder, tree version,
+    launch status version, target validity generation, HTML or JSON -
+    so a polling tablet gets the same bytes (and a 304) until one of
+    them moves. Entries also expire after their ttl (VALIDITY_TTL, or
+    a few seconds for a page rendered before every target answered):
+    serving a cached page skips the target checks, and a re-render is
+    what lets expired answers get revalidated. Least recently used pages are
+    dropped beyond max_pages.
+    """
+
+    def __init__(self, max_pages: int = 64):
+        self._lock = threading.Lock()
+        self.max_pages = max_pages
+        self._pages = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            page = self._pages.get(key)
+            if page is None:
+                return None
+            if time.monotonic() - page.created >= page.ttl:
+                del self._pages[key]
+                return None
+            self._pages.move_to_end(key)
+            return page
+
+    def put(self, key, page: CachedPage):
+        with self._lock:
+            self._pages[key] = page
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+
+
+page_cache = PageCache()
+
+
+# --- Icon sprite sheets ---
+
+class IconAtlases:
+    """One PNG sprite sheet per set of icons a page shows.
+
+    A page of 60 tiles would otherwise cost 60 BMP requests. Instead the
+    page's icons are scaled to ICON_PX and packed into one PNG, served
+    from /atlas/<id>.png, and each tile shows its cell of it through
+    background-position. The id is a hash of the icons' names, mtimes
+    and sizes, so an atlas URL's content never changes: browsers may
+    cache it for good, and a changed icon simply gets a new atlas.
+
+    Pages only register an atlas (a few stats); its PNG is built on the
+    first request for it and kept, up to max_atlases, least recently
+    used dropped first.
+    """
+
+    ICON_PX = 64
+    COLUMNS = 16
+
+    def __init__(self, max_atlases: int = 32):
+        self._lock = threading.Lock()
+        self.max_atlases = max_atlases
+        self._atlases = OrderedDict()  # id -> [icon names, PNG bytes or None]
+
+    def layout(self, names) -> tuple:
+        """Register an atlas for these icon names (existing BMPs only).
+
+        Returns (atlas id, {name: (x, y) offset}); the id is None when
+        there's nothing to pack or PIL isn't available."""
+        key = []
+        for name in sorted(set(names)):
+            try:
+                st = os.stat(ICONS_DIR / name)
+            except OSError:
+                continue
+            key.append(f'{name}\0{st.st_mtime_ns}\0{st.st_size}')
+        if not key or not PIL_AVAILABLE:
+            return None, {}
+        atlas_id = hashlib.sha1('\n'.join(key).encode('utf-8')).hexdigest()[:20]
+        packed = [entry.split('\0', 1)[0] for entry in key]
+        self.keep(atlas_id, packed)
+        return atlas_id, {name: self._offset(i) for i, name in enumerate(packed)}
+
+    def keep(self, atlas_id: str, names):
+        """(Re-)register an atlas of names (in packing order) under atlas_id.
+
+        Cached pages call this when they're served again, so an atlas
+        evicted since the page was rendered comes back rather than 404."""
+        with self._lock:
+            if atlas_id in self._atlases:
+                self._atlases.move_to_end(atlas_id)
+            else:
+                self._atlases[atlas_id] = [list(names), None]
+                while len(self._atlases) > self.max_atlases:
+                    self._atlases.popitem(last=False)
+
+    def png(self, atlas_id: str):
+        """The atlas's PNG bytes, built on first use; None if unknown."""
+        with self._lock:
+            entry = self._atlases.get(atlas_id)
+            if entry is None:
+                return None
+            self._atlases.move_to_end(atlas_id)
+            if entry[1] is None:
+                # Built under the lock: a page's tiles all ask at once
+                entry[1] = self._build(entry[0])
+            return entry[1]
+
+    def _offset(self, i: int) -> tuple:
+        return (i % self.COLUMNS) * self.ICON_PX, (i // self.COLUMNS) * self.ICON_PX
+
+    def _build(self, names) -> bytes:
+        size = self.ICON_PX
+        cols = min(len(names), self.COLUMNS)
+        rows = (len(names) + self.COLUMNS - 1) // self.COLUMNS
+        sheet = Image.new('RGBA', (cols * size, rows * size), (0, 0, 0, 0))
+        for i, name in enumerate(names):
+            try:
+                with Image.open(ICONS_DIR / name) as img:
+                    cell = img.convert('RGBA').resize((size, size), Image.NEAREST)
+            except Exception as e:
+                logger.error(f"Error packing icon {name}: {e}")
+                continue
+            sheet.paste(cell, self._offset(i))
+        out = io.BytesIO()
+        sheet.save(out, format='PNG', optimize=True)
+        logger.debug(f"Built icon atlas of {len(names)} icon(s), {out.tell()} bytes")
+        return out.getvalue()
+
+
+atlases = IconAtlases()
+
+
+def page_icons(items) -> tuple:
+    """The icons a page of items shows: (atlas id or None, {name: offset})."""
+    names = []
+    for item in items:
+        icon = item.icon or ''
+        if icon.endswith('.bmp'):
+            names.append(Path(icon).name)
+    atlas_id, offsets = atlases.layout(names)
+    if atlas_id is None:
+        # No PIL: tiles fall back to one <img> per icon
+        offsets = {name: None for name in set(names)
+                   if (ICONS_DIR / name).is_file()}
+    return atlas_id, offsets
+
+
 # --- HTML rendering (the bbs_page.py move: config in, page out) ---
 
 PAGE_STYLE = f"""
@@ -215,6 +495,12 @@ main {{
 }}
 .tile:active .box {{ border-style: inset; }}
 .tile .box img {{ width: 64px; height: 64px; image-rendering: pixelated; }}
+.tile .box .sprite {{
+    width: 64px;
+    height: 64px;
+    background-image: var(--atlas);
+    image-rendering: pixelated;
+}}
 .shortcut .box {{ background: {COLORS['light_gray']}; }}
 .folder .box {{ background: {COLORS['yellow']}; }}
 .tile .name {{
@@ -317,46 +603,88 @@ setInterval(pollStatus, 2000);
 """
 
 
-def render_icon(item: BaseItem) -> str:
-    """The icon box for a tile - BMP image if the native app has one,
-    else the same text-icon rule as widgets.py."""
+# Served from /static/ rather than inlined, so a browser fetches them once
+# per server version instead of with every page; the ?v= hash in their
+# URLs changes whenever they do.
+STATIC = {name: CachedPage(content_type, body.encode('utf-8'))
+          for name, content_type, body in (
+              ('deck.css', 'text/css; charset=utf-8', PAGE_STYLE),
+              ('deck.js', 'application/javascript; charset=utf-8', PAGE_SCRIPT))}
+
+
+def static_url(name: str) -> str:
+    return f'/static/{name}?v={STATIC[name].etag}'
+
+
+def render_icon(item: BaseItem, icons: dict) -> str:
+    """The icon box for a tile - its cell of the page's atlas (or its own
+    BMP) if the native app has an image, else the same text-icon rule
+    as widgets.py. icons is page_icons()'s {name: offset}."""
     icon = item.icon or ''
-    if icon.endswith('.bmp') and (ICONS_DIR / Path(icon).name).is_file():
-        return f'<img src="/icon/{quote(Path(icon).name)}" alt="">'
+    name = Path(icon).name
+    if icon.endswith('.bmp') and name in icons:
+        offset = icons[name]
+        if offset is None:
+            return f'<img src="/icon/{quote(name)}" alt="">'
+        return (f'<span class="sprite" '
+                f'style="background-position: {-offset[0]}px {-offset[1]}px"></span>')
     text = icon[:2] if 0 < len(icon) <= 2 else item.name[:1].upper()
     return html.escape(text)
 
 
-def render_tile(item: BaseItem, segments, statuses: dict) -> str:
+def broken_targets(items) -> set:
+    """Target paths of these items' shortcuts that are known to be broken.
+
+    Checked in parallel on the launcher's worker threads, waiting at most
+    SERVER_VALIDATE_TIMEOUT for the whole page; a target on a hung mount
+    that hasn't answered by then is shown as fine rather than stalling."""
+    return check_page_targets(items)[0]
+
+
+def check_page_targets(items) -> tuple:
+    """(broken_targets(items), whether every target answered in time)."""
+    paths = [item.path for item in items if isinstance(item, Shortcut)]
+    checked = check_targets(paths, SERVER_VALIDATE_TIMEOUT)
+    broken = {path for path, valid in checked.items() if valid is False}
+    return broken, None not in checked.values()
+
+
+def render_tile(item: BaseItem, segments, statuses: dict, broken: set,
+                icons: dict) -> str:
     item_id = encode_id(segments)
     name = html.escape(item.name)
     if isinstance(item, Folder):
         return (f'<a class="tile folder" href="/folder/{item_id}">'
-                f'<span class="box">{render_icon(item)}</span>'
+                f'<span class="box">{render_icon(item, icons)}</span>'
                 f'<span class="name">{name}</span></a>')
-    broken = '' if is_valid_target(item.path) else ' broken'
+    broken = ' broken' if item.path in broken else ''
     status = statuses.get(item_id)
     badge_class = f'badge st-{status}' if status else 'badge'
     return (f'<form class="launch" method="POST" action="/launch">'
             f'<input type="hidden" name="id" value="{html.escape(item_id)}">'
             f'<button class="tile shortcut{broken}" type="submit" '
             f'data-id="{html.escape(item_id)}">'
-            f'<span class="box">{render_icon(item)}'
+            f'<span class="box">{render_icon(item, icons)}'
             f'<span class="{badge_class}"></span></span>'
             f'<span class="name">{name}</span></button></form>')
 
 
-def render_page(segments, items: dict, statuses: dict) -> str:
-    """Render one folder level (segments == [] for the top level)."""
+def render_page(segments, items: dict, statuses: dict, broken: set,
+                icons: tuple = None) -> str:
+    """Render one folder level (segments == [] for the top level).
+
+    icons is page_icons(items.values()), if the caller already has it."""
     crumbs = ['<a href="/">HOME</a>']
     for i, seg in enumerate(segments):
         crumbs.append(f'<a href="/folder/{encode_id(segments[:i + 1])}">'
                       f'{html.escape(seg)}</a>')
     breadcrumb = ' <span>&gt;</span> '.join(crumbs)
 
-    tiles = [render_tile(item, segments + [name], statuses)
+    atlas_id, icons = icons or page_icons(items.values())
+    tiles = [render_tile(item, segments + [name], statuses, broken, icons)
              for name, item in items.items()]
     grid = '\n'.join(tiles) if tiles else '<p class="empty">No shortcuts here.</p>'
+    atlas = f' style="--atlas: url(/atlas/{atlas_id}.png)"' if atlas_id else ''
 
     title = html.escape(get_app_name())
     return f"""<!DOCTYPE html>
@@ -365,36 +693,53 @@ def render_page(segments, items: dict, statuses: dict) -> str:
 <meta charset="utf-8">
 <meta name="viewport" content="width=device-width, initial-scale=1">
 <title>{title}</title>
-<style>{PAGE_STYLE}</style>
+<link rel="stylesheet" href="{static_url('deck.css')}">
 </head>
 <body>
 <header><h1>{title}</h1><nav>{breadcrumb}</nav><nav class="loglink"><a href="/log">LOG</a></nav></header>
-<main>
+<main{atlas}>
 {grid}
 </main>
 <footer>Magic Launcher Server v{VERSION} - read-only view, edit in the native app</footer>
-<script>{PAGE_SCRIPT}</script>
+<script src="{static_url('deck.js')}"></script>
 </body>
 </html>"""
 
 
-def items_json(segments, items: dict, statuses: dict) -> dict:
+def items_json(segments, items: dict, statuses: dict, broken: set) -> dict:
     """The agent-facing view of one folder level: ids, names, types and
     launch status only. Deliberately no paths or args - the launcher
     reports what can be launched and what happened, nothing more."""
+    out = [tile_json(encode_id(segments + [name]), name, item, statuses, broken)
+           for name, item in items.items()]
+    return {'path': segments, 'items': out}
+
+
+def tile_json(item_id: str, name: str, item: BaseItem, statuses: dict,
+              broken: set) -> dict:
+    """One tile's JSON entry: id, name, type and, for shortcuts, status."""
+    entry = {'id': item_id, 'name': name}
+    if isinstance(item, Folder):
+        entry['type'] = 'folder'
+    else:
+        entry['type'] = 'shortcut'
+        entry['status'] = statuses.get(item_id)
+        if item.path in broken:
+            entry['broken'] = True
+    return entry
+
+
+def search_json(query: str, limit: int, statuses: dict) -> dict:
+    """Ranked fuzzy matches across the whole tree, best first. Same
+    entries as a folder listing, plus the folder each match lives in."""
     out = []
-    for name, item in items.items():
-        item_id = encode_id(segments + [name])
-        entry = {'id': item_id, 'name': name}
-        if isinstance(item, Folder):
-            entry['type'] = 'folder'
-        else:
-            entry['type'] = 'shortcut'
-            entry['status'] = statuses.get(item_id)
-            if not is_valid_target(item.path):
-                entry['broken'] = True
+    results = tree_cache.search_index().fuzzy_search(query, limit)
+    broken = broken_targets(item for _, item, _ in results)
+    for _, item, path in results:
+        entry = tile_json(encode_id(path + [item.name]), item.name, item, statuses, broken)
+        entry['folder'] = path
         out.append(entry)
-    return {'path': segments, 'items': out}
+    return {'query': query, 'items': out}
 
 
 def render_log_page(events) -> str:
@@ -419,7 +764,7 @@ def render_log_page(events) -> str:
 <meta name="viewport" content="width=device-width, initial-scale=1">
 <meta http-equiv="refresh" content="5">
 <title>{title} - Log</title>
-<style>{PAGE_STYLE}</style>
+<link rel="stylesheet" href="{static_url('deck.css')}">
 </head>
 <body>
 <header><h1>{title}</h1><nav><a href="/">HOME</a> <span>&gt;</span> LOG</nav></header>
@@ -429,19 +774,112 @@ def render_log_page(events) -> str:
 </html>"""
 
 
+def _vary(vary, header: str) -> str:
+    """A Vary value with header added (once)."""
+    names = [name.strip() for name in (vary or '').split(',') if name.strip()]
+    if header not in names:
+        names.append(header)
+    return ', '.join(names)
+
+
 class StreamDeckHandler(BaseHTTPRequestHandler):
     server_version = f"MagicLauncherServer/{VERSION}"
 
     def log_message(self, format, *args):
         logger.info(f"{self.address_string()} - {format % args}")
 
-    def _send(self, code: int, content_type: str, body: bytes):
+    def _send(self, code: int, content_type: str, body: bytes,
+              headers: dict = None, gzipped=None):
+        """Write a response, gzipped if it's worth it and the client takes it.
+
+        gzipped, if given, returns the body already compressed (a
+        CachedPage's, compressed once); otherwise it's compressed here."""
+        headers = dict(headers or {})
+        use_gzip = self._gzip_choice(content_type, body)
+        if use_gzip is not None:
+            # The body depends on Accept-Encoding whichever way it went
+            headers['Vary'] = _vary(headers.get('Vary'), 'Accept-Encoding')
+        if use_gzip:
+            body = gzipped() if gzipped else gzip.compress(body, GZIP_LEVEL)
+            headers['Content-Encoding'] = 'gzip'
         self.send_response(code)
         self.send_header('Content-Type', content_type)
         self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
         self.end_headers()
         self.wfile.write(body)
 
+    def _gzip_choice(self, content_type: str, body: bytes):
+        """None if body isn't worth compressing, else whether to gzip it."""
+        if (len(body) < GZIP_MIN_BYTES
+                or not content_type.startswith(COMPRESSIBLE_TYPES)):
+            return None
+        return self._accepts_gzip()
+
+    def _accepts_gzip(self) -> bool:
+        for coding in (self.headers.get('Accept-Encoding') or '').split(','):
+            name, _, params = coding.partition(';')
+            if name.strip().lower() != 'gzip':
+                continue
+            params = params.replace(' ', '')
+            return not params.startswith('q=') or params[2:].strip('0.') != ''
+        return False
+
+    def _not_modified(self, etag: str, cache_control: str, vary: str = None,
+                      compressible: bool = False) -> bool:
+        """Answer 304 if the client's If-None-Match already has etag.
+
+        With compressible, the gzipped representation's tag (etag-gz)
+        matches too, for a client that takes gzip - so callers can check
+        before rendering a body whose size (and so encoding) isn't known
+        yet. Either tag names this version, in the encoding the client
+        would get again."""
+        match = self.headers.get('If-None-Match') or ''
+        tags = [tag.strip().removeprefix('W/') for tag in match.split(',')]
+        candidates = [etag]
+        if compressible:
+            vary = _vary(vary, 'Accept-Encoding')
+            if self._accepts_gzip():
+                candidates.insert(0, etag + '-gz')
+        matched = next((tag for tag in candidates if f'"{tag}"' in tags),
+                       candidates[0] if '*' in tags else None)
+        if matched is None:
+            return False
+        self.send_response(304)
+        for name, value in self._validators(matched, cache_control, vary).items():
+            self.send_header(name, value)
+        self.end_headers()
+        return True
+
+    def _send_cached(self, content_type: str, body: bytes, etag: str,
+                     cache_control: str, vary: str = None, gzipped=None):
+        """200 with body and validators, or a 304 if the client has it."""
+        use_gzip = self._gzip_choice(content_type, body)
+        tag = etag + '-gz' if use_gzip else etag
+        if self._not_modified(tag, cache_control,
+                              _vary(vary, 'Accept-Encoding') if use_gzip is not None else vary):
+            return
+        self._send_tagged(content_type, body, etag, cache_control, vary, gzipped)
+
+    def _send_tagged(self, content_type: str, body: bytes, etag: str,
+                     cache_control: str, vary: str = None, gzipped=None):
+        """200 with body and validators, for callers that already ran
+        _not_modified(). The gzipped and plain bodies are different
+        representations, so they get different (strong) ETags."""
+        use_gzip = self._gzip_choice(content_type, body)
+        if use_gzip:
+            etag += '-gz'
+        self._send(200, content_type, body,
+                   self._validators(etag, cache_control, vary), gzipped)
+
+    @staticmethod
+    def _validators(etag: str, cache_control: str, vary: str = None) -> dict:
+        headers = {'ETag': f'"{etag}"', 'Cache-Control': cache_control}
+        if vary:
+            headers['Vary'] = vary
+        return headers
+
     def _send_html(self, code: int, text: str):
         self._send(code, 'text/html; charset=utf-8', text.encode('utf-8'))
 
@@ -452,14 +890,37 @@ class StreamDeckHandler(BaseHTTPRequestHandler):
         self._send(code, 'application/json',
                    json.dumps(data).encode('utf-8'))
 
-    def _send_page(self, segments, items):
-        # Re-check target validity per page load so the red-X/broken
-        # state tracks the filesystem, not the first request's cache.
-        clear_validity_cache()
-        if self._wants_json():
-            self._send_json(200, items_json(segments, items, tracker.statuses()))
-        else:
-            self._send_html(200, render_page(segments, items, tracker.statuses()))
+    def _send_page(self, segments, items, tree_version: int):
+        # Validity answers expire and get revalidated on their own (and
+        # are evicted by inotify on Linux), so the red X tracks the
+        # filesystem without re-checking every target on every load.
+        wants_json = self._wants_json()
+        status_version, statuses = tracker.snapshot()
+        key = (tuple(segments), tree_version, status_version,
+               validity_generation(), 'json' if wants_json else get_app_name())
+        page = page_cache.get(key)
+        if page is None:
+            broken, settled = check_page_targets(items.values())
+            # A target still being checked (say, on a hung mount) may yet
+            # turn out broken, and its answer needn't move the validity
+            # generation: such a page is cached, but only briefly
+            ttl = VALIDITY_TTL if settled else SERVER_UNSETTLED_PAGE_TTL
+            if wants_json:
+                page = CachedPage('application/json', json.dumps(
+                    items_json(segments, items, statuses, broken)).encode('utf-8'),
+                    ttl=ttl)
+            else:
+                icons = page_icons(items.values())
+                atlas = (icons[0], list(icons[1])) if icons[0] else None
+                page = CachedPage('text/html; charset=utf-8', render_page(
+                    segments, items, statuses, broken, icons).encode('utf-8'), atlas,
+                    ttl=ttl)
+            page_cache.put(key, page)
+        elif page.atlas is not None:
+            # The sheet may have been evicted since; the page still links it
+            atlases.keep(*page.atlas)
+        self._send_cached(page.content_type, page.body, page.etag, 'no-cache',
+                          vary='Accept', gzipped=page.gzipped)
 
     def _not_found(self):
         if self._wants_json():
@@ -471,13 +932,37 @@ class StreamDeckHandler(BaseHTTPRequestHandler):
         path = urlparse(self.path).path
 
         if path == '/':
-            self._send_page([], load_tree())
+            version, index = tree_cache.snapshot()
+            self._send_page([], index.tree, version)
+        elif path == '/search':
+            # JSON only - it's for scripts and agents, not the deck
+            params = parse_qs(urlparse(self.path).query)
+            query = params.get('q', [''])[0].strip()
+            try:
+                limit = min(int(params.get('limit', [SEARCH_LIMIT])[0]), SEARCH_LIMIT)
+            except ValueError:
+                limit = SEARCH_LIMIT
+            if not query:
+                self._send_json(400, {'error': 'missing q'})
+            else:
+                self._send_json(200, search_json(query, max(limit, 1),
+                                                 tracker.statuses()))
         elif path == '/status':
-            payload = json.dumps(tracker.statuses()).encode('utf-8')
-            self._send(200, 'application/json', payload)
+            # Polled every 2s by every open deck: mostly a 304
+            version, statuses = tracker.snapshot()
+            etag = f'{RUN_ID}-{version}'
+            if not self._not_modified(etag, 'no-cache', compressible=True):
+                payload = json.dumps(statuses).encode('utf-8')
+                self._send_tagged('application/json', payload, etag, 'no-cache')
         elif path == '/log':
+            # The log only grows when a status changes
+            version = tracker.snapshot()[0]
+            kind = 'json' if self._wants_json() else get_app_name()
+            etag = hashlib.sha1(f'{RUN_ID}\0{version}\0{kind}'.encode('utf-8')).hexdigest()[:20]
+            if self._not_modified(etag, 'no-cache', vary='Accept', compressible=True):
+                return
             events = tracker.log()
-            if 'application/json' in (self.headers.get('Accept') or ''):
+            if kind == 'json':
                 payload = json.dumps([
                     {'time': ts,
                      'iso': time.strftime('%Y-%m-%dT%H:%M:%S',
@@ -486,17 +971,27 @@ class StreamDeckHandler(BaseHTTPRequestHandler):
                      'shortcut': decode_id(item_id),
                      'status': status}
                     for ts, item_id, status in events]).encode('utf-8')
-                self._send(200, 'application/json', payload)
+                self._send_tagged('application/json', payload, etag, 'no-cache',
+                                  vary='Accept')
             else:
-                self._send_html(200, render_log_page(events))
+                self._send_tagged('text/html; charset=utf-8',
+                                  render_log_page(events).encode('utf-8'), etag,
+                                  'no-cache', vary='Accept')
         elif path.startswith('/folder/'):
-            item_id = path[len('/folder/'):].rstrip('/')
-            item = resolve(load_tree(), item_id)
-            if isinstance(item, Folder):
-                segments = [unquote(seg) for seg in item_id.split('/')]
-                self._send_page(segments, item.items)
+            version, index = tree_cache.snapshot()
+            entry = index.resolve_id(path[len('/folder/'):].rstrip('/'))
+            if entry is not None and isinstance(entry.item, Folder):
+                self._send_page(list(entry.path), entry.item.items, version)
             else:
                 self._not_found()
+        elif path.startswith('/static/') and path[len('/static/'):] in STATIC:
+            name = path[len('/static/'):]
+            page = STATIC[name]
+            self._send_cached(page.content_type, page.body, page.etag,
+                              'public, max-age=31536000, immutable',
+                              gzipped=page.gzipped)
+        elif path.startswith('/atlas/') and path.endswith('.png'):
+            self._serve_atlas(path[len('/atlas/'):-len('.png')])
         elif path.startswith('/icon/'):
             self._serve_icon(path[len('/icon/'):])
         else:
@@ -512,10 +1007,29 @@ class StreamDeckHandler(BaseHTTPRequestHandler):
             self._not_found()
             return
         icon_path = ICONS_DIR / name
-        if not icon_path.is_file():
+        try:
+            st = icon_path.stat()
+        except OSError:
+            st = None
+        if st is None or not icon_path.is_file():
+            self._not_found()
+            return
+        # Same URL for a changed icon, so the browser asks again each
+        # time - and mostly gets a 304 without the file being read
+        etag = f'{st.st_mtime_ns:x}-{st.st_size:x}'
+        if self._not_modified(etag, 'no-cache', compressible=True):
+            return
+        self._send_tagged('image/bmp', icon_path.read_bytes(), etag, 'no-cache')
+
+    def _serve_atlas(self, atlas_id: str):
+        """Serve a sprite sheet registered by page_icons(). Its id names
+        its content, so browsers can keep it indefinitely."""
+        body = atlases.png(atlas_id)
+        if body is None:
             self._not_found()
             return
-        self._send(200, 'image/bmp', icon_path.read_bytes())
+        self._send_cached('image/png', body, atlas_id,
+                          'public, max-age=31536000, immutable')
 
     def do_POST(self):
         if urlparse(self.path).path != '/launch':
@@ -531,17 +1045,17 @@ class StreamDeckHandler(BaseHTTPRequestHandler):
 
         # THE rule: resolve the id against the trusted config. Only an
         # entry that exists there as a Shortcut ever reaches launch().
-        item = resolve(load_tree(), item_id)
-        if not isinstance(item, Shortcut):
+        entry = resolve(item_id)
+        if entry is None or not isinstance(entry.item, Shortcut):
             logger.warning(f"Refused launch for unresolved id: {item_id!r}")
             self._respond_launch(False, refused=True)
             return
 
         # Canonical id (client encoding may differ) so the tracker key
         # always matches the data-id the tiles are rendered with.
-        canonical_id = encode_id(unquote(seg) for seg in item_id.split('/'))
+        item = entry.item
         proc = Launcher.launch_process(item.path, item.args)
-        status = tracker.start(canonical_id, proc)
+        status = tracker.start(entry.id, proc)
         self._respond_launch(proc is not None, status=status)
 
     def _respond_launch(self, ok: bool, refused: bool = False,
@@ -569,6 +1083,7 @@ def main():
     args = parser.parse_args()
 
     server = ThreadingHTTPServer((args.host, args.port), StreamDeckHandler)
+    start_validity_watcher()
     print(f"Magic Launcher Server v{VERSION}")
     print(f"Serving {CONFIG_FILE}")
     print(f"Listening on http://{args.host}:{args.port}/")
@@ -0,0 +1,246 @@
+"""Tiles drawn as items on one canvas - the "renderer": "canvas" option.
+
+An IconWidget is a Frame, a Frame, two Labels and sometimes an overlay
+Canvas: four or five Tk windows per tile, each a handful of X11 round
+trips to create, map and configure. Over SSH X11 forwarding that adds
+up. CanvasTile draws the same tile as rectangles, text, an image and two
+lines on MainWindow.canvas, so the whole grid is one window.
+
+Clicks are hit-tested through canvas tags: every item of a tile carries
+the shared 'tile' tag and that tile's own tag, and CanvasTiles maps the
+'current' item's tile tag back to its CanvasTile.
+
+CanvasTile has the same surface MainWindow uses on IconWidget - set_item,
+place, place_forget, set_highlighted, destroy, item, path - so the
+virtual grid drives either one.
+"""
+
+import itertools
+import tkinter as tk
+from typing import Callable, Dict, List, Optional
+
+from constants import COLORS, ICON_SIZE, LABEL_BASE_WIDTH
+from models import BaseItem, Folder
+from ui.widgets import PendingResult, watch_icon, watch_target
+
+TILE_TAG = 'tile'
+ICON_FONT = ('DejaVu Sans Mono', 36, 'bold')
+NAME_FONT = ('DejaVu Sans Mono', 10)
+NAME_CHAR_WIDTH = 8  # approximate pixels per NAME_FONT character
+BROKEN_MARGIN = 15
+
+
+class CanvasTiles:
+    """Creates CanvasTiles on a canvas and routes its mouse events."""
+
+    def __init__(self, canvas: tk.Canvas, on_click: Callable = None,
+                 on_double_click: Callable = None, on_right_click: Callable = None):
+        self.canvas = canvas
+        self.on_click = on_click
+        self.on_double_click = on_double_click
+        self.on_right_click = on_right_click
+        self._tiles: Dict[str, 'CanvasTile'] = {}
+        self._tags = (f'tile{n}' for n in itertools.count())
+
+        canvas.tag_bind(TILE_TAG, '<ButtonPress-1>', self._on_press)
+        canvas.tag_bind(TILE_TAG, '<ButtonRelease-1>', self._on_release)
+        canvas.tag_bind(TILE_TAG, '<Double-Button-1>', self._on_double_click)
+        canvas.tag_bind(TILE_TAG, '<Button-3>', self._on_right_click)
+        canvas.tag_bind(TILE_TAG, '<Enter>', self._on_enter)
+        canvas.tag_bind(TILE_TAG, '<Leave>', self._on_release)
+
+    def new_tile(self, item: BaseItem, path: List[str] = None) -> 'CanvasTile':
+        tag = next(self._tags)
+        tile = CanvasTile(self, tag, item, path)
+        self._tiles[tag] = tile
+        return tile
+
+    def _forget(self, tag: str):
+        self._tiles.pop(tag, None)
+
+    def _hit(self) -> Optional['CanvasTile']:
+        """The tile under the pointer, found through the 'current' item's tags."""
+        current = self.canvas.find_withtag('current')
+        if not current:
+            return None
+        for tag in self.canvas.gettags(current[0]):
+            tile = self._tiles.get(tag)
+            if tile is not None:
+                return tile
+        return None
+
+    def _on_press(self, event):
+        tile = self._hit()
+        if tile is not None:
+            tile.set_pressed(True)
+            if self.on_click:
+                self.on_click(tile.item, tile.path)
+
+    def _on_release(self, event):
+        tile = self._hit()
+        if tile is not None:
+            tile.set_pressed(False)
+
+    def _on_enter(self, event):
+        tile = self._hit()
+        if tile is not None:
+            tile.set_pressed(True)
+
+    def _on_double_click(self, event):
+        tile = self._hit()
+        if tile is not None and self.on_double_click:
+            self.on_double_click(tile.item, tile.path)
+
+    def _on_right_click(self, event):
+        tile = self._hit()
+        if tile is not None and self.on_right_click:
+            self.on_right_click(event, tile.item, tile.path)
+
+
+class CanvasTile:
+    """One launcher icon drawn as canvas items, laid out like IconWidget."""
+
+    def __init__(self, owner: CanvasTiles, tag: str, item: BaseItem,
+                 path: List[str] = None):
+        self.owner = owner
+        self.canvas = owner.canvas
+        self.tag = tag
+        self.image = None  # Keep reference
+        self.broken = False
+        self.target_state = 'unknown'  # 'ok', 'broken' or 'unknown'
+        self._target_check: Optional[PendingResult] = None
+        self._icon_load: Optional[PendingResult] = None
+        self.tk_widget = self.canvas  # what PendingResult schedules after() on
+        self.visible = False
+
+        # Items are drawn for a tile at (0, 0) and moved into place
+        tags = (TILE_TAG, tag)
+        left = (120 - ICON_SIZE) // 2
+        top = 10
+        mid_x, mid_y = 60, top + ICON_SIZE // 2
+        create = self.canvas
+        self.box = create.create_rectangle(left, top, left + ICON_SIZE, top + ICON_SIZE,
+                                           width=3, outline=COLORS['white'],
+                                           tags=tags, state='hidden')
+        self.icon_image = create.create_image(mid_x, mid_y, tags=tags, state='hidden')
+        self.icon_text = create.create_text(mid_x, mid_y, font=ICON_FONT,
+                                            fill=COLORS['black'], tags=tags, state='hidden')
+        self.highlight = create.create_rectangle(left + 4, top + 4,
+                                                 left + ICON_SIZE - 4, top + ICON_SIZE - 4,
+                                                 width=2, outline=COLORS['yellow'],
+                                                 tags=tags, state='hidden')
+        inner = ICON_SIZE - 6 - 2 * BROKEN_MARGIN
+        x0, y0 = left + 3 + BROKEN_MARGIN, top + 3 + BROKEN_MARGIN
+        self.cross = (
+            create.create_line(x0, y0, x0 + inner, y0 + inner, fill=COLORS['red'],
+                               width=4, capstyle='round', tags=tags, state='hidden'),
+            create.create_line(x0 + inner, y0, x0, y0 + inner, fill=COLORS['red'],
+                               width=4, capstyle='round', tags=tags, state='hidden'),
+        )
+        name_y = top + ICON_SIZE + 5 + 10
+        self.name_bg = create.create_rectangle(0, name_y - 10, 0, name_y + 10,
+                                               fill=COLORS['blue'], width=0,
+                                               tags=tags, state='hidden')
+        self.name_text = create.create_text(mid_x, name_y, font=NAME_FONT,
+                                            fill=COLORS['white'], tags=tags, state='hidden')
+        self._x = self._y = 0
+        self.set_item(item, path)
+
+    def set_item(self, item: BaseItem, path: List[str] = None):
+        """Show a (possibly different) item in this tile."""
+        self.item = item
+        self.path = path or []
+        canvas = self.canvas
+
+        icon_color = COLORS['yellow'] if isinstance(item, Folder) else COLORS['light_gray']
+        canvas.itemconfigure(self.box, fill=icon_color)
+        self.set_pressed(False)
+
+        if self._icon_load is not None:
+            self._icon_load.cancel()
+        self._icon_load = watch_icon(self, item)
+
+        if self._target_check is not None:
+            self._target_check.cancel()
+        self._target_check = watch_target(self, item)
+
+        chars = LABEL_BASE_WIDTH * 2 if len(item.name) >= 12 else LABEL_BASE_WIDTH
+        half = (chars * NAME_CHAR_WIDTH) // 2 + 2
+        x1, y1, x2, y2 = canvas.coords(self.name_bg)
+        canvas.coords(self.name_bg, self._x + 60 - half, y1, self._x + 60 + half, y2)
+        canvas.itemconfigure(self.name_text, text=item.name[:chars])
+
+        self.highlighted = False
+        self._apply_states()
+
+    def _apply_states(self):
+        """Show the parts this item needs, or nothing when unplaced."""
+        canvas = self.canvas
+        if not self.visible:
+            canvas.itemconfigure(self.tag, state='hidden')
+            return
+
+        def show(item_id, shown):
+            canvas.itemconfigure(item_id, state='normal' if shown else 'hidden')
+
+        # Like IconWidget's overlay, the X replaces the icon
+        show(self.box, True)
+        has_image = bool(self.image)
+        show(self.icon_image, has_image and not self.broken)
+        show(self.icon_text, not has_image and not self.broken)
+        show(self.highlight, self.highlighted)
+        for line in self.cross:
+            show(line, self.broken)
+        show(self.name_bg, True)
+        show(self.name_text, True)
+
+    def set_image(self, image):
+        """Show an image icon, or the item's text icon for None."""
+        self.image = image
+        if image:
+            self.canvas.itemconfigure(self.icon_image, image=image)
+        else:
+            item = self.item
+            icon_text = item.icon[:2] if len(item.icon) <= 2 else item.name[0].upper()
+            self.canvas.itemconfigure(self.icon_text, text=icon_text)
+        if self.visible:
+            self._apply_states()
+
+    def set_broken(self, broken: Optional[bool]):
+        """Show or hide the red X; None means not known yet (no X)."""
+        self.target_state = {True: 'broken', False: 'ok', None: 'unknown'}[broken]
+        self.broken = bool(broken)
+        if self.visible:
+            self._apply_states()
+
+    def place(self, x: int = 0, y: int = 0, **kwargs):
+        """Move the tile's top-left corner to (x, y) and show it."""
+        if (x, y) != (self._x, self._y):
+            self.canvas.move(self.tag, x - self._x, y - self._y)
+            self._x, self._y = x, y
+        if not self.visible:
+            self.visible = True
+            self._apply_states()
+
+    def place_forget(self):
+        self.visible = False
+        self.canvas.itemconfigure(self.tag, state='hidden')
+
+    def set_highlighted(self, highlighted: bool):
+        """Set highlight state"""
+        self.highlighted = highlighted
+        if self.visible:
+            self.canvas.itemconfigure(self.highlight,
+                                      state='normal' if highlighted else 'hidden')
+
+    def set_pressed(self, pressed: bool):
+        """Sunken/raised look of the icon box."""
+        self.canvas.itemconfigure(
+            self.box, outline=COLORS['dark_gray'] if pressed else COLORS['white'])
+
+    def destroy(self):
+        for pending in (self._target_check, self._icon_load):
+            if pending is not None:
+                pending.cancel()
+        self.canvas.delete(self.tag)
+        self.owner._forget(self.tag)
@@ -0,0 +1,108 @@
+"""Folder views kept built for going back - the "view_cache_size" option.
+
+Leaving a folder parks its grid rather than tearing it down: the item
+list, the placed tiles and the scroll position go into a GridView, its
+tiles hidden, in an LRU keyed by folder path. Going back shows it again
+with every tile still bound.
+
+Views that fall off the LRU, and views of a search or the lock screen,
+are retired: one is kept blank, its tiles spare, and handed out as the
+next new view, so flipping between views doesn't create and destroy
+tiles; the rest are destroyed.
+
+MainWindow owns the view on screen and its tile pool; ViewCache only
+holds the views that aren't. With a size of 0 nothing is parked and
+every switch starts from a blank view.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Optional, Sequence, Tuple
+
+
+class GridView:
+    """A folder's grid, parked while another view is on screen.
+
+    Holds what MainWindow keeps for the current view: the item list,
+    the placed tiles and spare tiles, plus the column count and scroll
+    position it was laid out with."""
+
+    __slots__ = ('items', 'tile_at', 'spare', 'cols', 'top')
+
+    def __init__(self, items, tile_at, spare, cols, top):
+        self.items = items
+        self.tile_at = tile_at
+        self.spare = spare
+        self.cols = cols
+        self.top = top
+
+
+class ViewCache:
+    """Parked folder views, least recently used first, and one to recycle.
+
+    Tiles (WindowTiles or CanvasTiles) are items on the grid canvas, so
+    hiding a view hides its tiles; place_tile(widget, index) puts one
+    back in its cell at the current width."""
+
+    def __init__(self, size: int, place_tile: Callable):
+        self.size = size
+        self.place_tile = place_tile
+        self._views: 'OrderedDict[Tuple[str, ...], GridView]' = OrderedDict()
+        self._free: Optional[GridView] = None  # recycled by new_view
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def new_view(self, cols: int) -> GridView:
+        """An empty view, recycling a retired one's spare tiles if any."""
+        view = self._free
+        if view is not None:
+            self._free = None
+            return view
+        return GridView([], {}, [], cols, 0.0)
+
+    def park(self, path: Optional[Sequence[str]], view: GridView):
+        """Take view off screen: kept under folder path, or retired if
+        path is None (not a folder view) or the cache is off."""
+        if path is None or not self.size:
+            self.retire(view)
+            return
+        self.hide(view)
+        for widget in view.spare:
+            widget.destroy()
+        view.spare.clear()
+        self._views[tuple(path)] = view
+
+    def take(self, path: Optional[Sequence[str]]) -> Optional[GridView]:
+        """Folder path's parked view, out of the cache, or None; the
+        least recently used views past the size are retired."""
+        view = self._views.pop(tuple(path), None) if path is not None else None
+        while len(self._views) > self.size:
+            self.retire(self._views.popitem(last=False)[1])
+        return view
+
+    def drop(self, path: Optional[Sequence[str]] = None):
+        """Retire the views of folder path and everything below it (all if None)."""
+        for key in list(self._views):
+            if path is None or key[:len(path)] == tuple(path):
+                self.retire(self._views.pop(key))
+
+    def hide(self, view: GridView):
+        for widget in view.tile_at.values():
+            widget.place_forget()
+
+    def show(self, view: GridView):
+        for index, widget in view.tile_at.items():
+            self.place_tile(widget, index)
+
+    def retire(self, view: GridView):
+        """Take a view off screen for good: keep one to recycle, destroy the rest."""
+        self.hide(view)
+        view.spare.extend(view.tile_at.values())
+        view.tile_at.clear()
+        view.items = []
+        view.top = 0.0
+        if self._free is None:
+            self._free = view
+            return
+        for widget in view.spare:
+            widget.destroy()
@@ -4,14 +4,22 @@ import tkinter as tk
 from tkinter import messagebox, simpledialog
 from typing import Dict, List, Tuple, Optional
 import json
+import queue
 import time
 
 from constants import *
 from models import BaseItem, Folder, Shortcut, item_from_dict
 from config import config_manager
-from utils.launcher import Launcher, is_valid_target, clear_validity_cache
+from utils.launcher import (Launcher, is_valid_target, clear_validity_cache,
+                            start_validity_watcher)
+from utils.journal import op_set, op_delete, op_edit
+from utils.icons import icon_manager
 from utils.logger import logger
-from ui.widgets import IconWidget, SearchBar
+from utils.search import SearchIndex
+from utils.tree_index import TreeIndex
+from ui.canvas_tiles import CanvasTiles
+from ui.grid_views import GridView, ViewCache
+from ui.widgets import IconWidget, SearchBar, WindowTile
 from ui.dialogs import ItemDialog
 
 
@@ -67,12 +75,45 @@ class MainWindow:
 
         # State
         self.shortcuts: Dict[str, BaseItem] = {}
+        self.tree_version = 0  # bumped by _tree_changed() on every edit
+        self._index: Optional[TreeIndex] = None
+        self._index_version = -1
+        self._search_index: Optional[SearchIndex] = None
+        self._search_index_version = -1
         self.current_path: List[str] = []
         self.search_active = False
         self.search_query = ""
         self.selected_item: Optional[Tuple[BaseItem, List[str]]] = None
+        self._selected_index: Optional[int] = None  # into _view_items
         self.dialog_open = False
 
+        # Chunked rendering: each render_items() bumps the generation, and
+        # chunks queued by an older render see that and stop
+        self._render_gen = 0
+        self._render_job = None
+        # request_render() coalesces: any number of requests before the
+        # next idle turn become one render_items()
+        self._render_request = None
+        self.renders_coalesced = 0
+        self._relayout_job = None  # debounced resize, see _on_canvas_configure
+        self._prefetch_job = None  # idle icon prefetch, see _prefetch_icons
+        self._save_watch = None  # after() id polling the background writer
+        # The ".." tile's item, reused so it keeps its identity across renders
+        self._back_item = Shortcut(name='..', icon='^', path='')
+        self._back_item.type = 'up'
+        # Virtual grid: _view_items is everything in the current view, but
+        # only rows near the viewport have a tile. _tile_at maps item index
+        # -> placed WindowTile (or CanvasTile); _spare tiles are hidden, ready to be rebound
+        # (IconWidget.set_item) to whatever scrolls into view next.
+        self._view_items: List[Tuple[str, BaseItem, List[str]]] = []
+        self._tile_at: Dict[int, IconWidget] = {}
+        self._spare: List[IconWidget] = []
+        self._view_key = None
+        # Recently visited folder views, hidden but fully built (see
+        # ui/grid_views.py). Edits drop the affected folders
+        # (_tree_changed), a reload drops all. Made with the canvas.
+        self._views: Optional[ViewCache] = None
+
         # Lock state - auto-lock on startup if a password is set
         # (delete password.txt to disable)
         self.locked = bool(self._get_password())
@@ -83,6 +124,7 @@ class MainWindow:
 
         # Load data
         self.load_shortcuts()
+        start_validity_watcher()  # Linux only; elsewhere checks just expire
         
         # Create UI
         self._create_ui()
@@ -96,16 +138,66 @@ class MainWindow:
     def load_shortcuts(self):
         """Load shortcuts from config."""
         self.shortcuts = config_manager.load_shortcuts()
+        self._tree_changed()
+        # The reload may have dropped the folder we're in: step back to
+        # its nearest surviving ancestor, or edits here would be
+        # journaled under a path that no longer exists
+        index = self._get_index()
+        path = tuple(self.current_path)
+        while path and not isinstance(getattr(index.lookup(path), 'item', None), Folder):
+            path = path[:-1]
+        self.current_path = list(path)
+
+    def _tree_changed(self, path: Optional[List[str]] = None):
+        """Note that self.shortcuts was edited, so derived data is stale.
+
+        path is the folder whose contents changed; cached views of it and
+        of everything below it are dropped. None means the whole tree."""
+        self.tree_version += 1
+        if self._views is not None:
+            self._views.drop(path)
+
+    def _get_index(self) -> TreeIndex:
+        """The id/path index for the current tree version."""
+        if self._index_version != self.tree_version:
+            self._index = TreeIndex(self.shortcuts)
+            self._index_version = self.tree_version
+        return self._index
+
+    def _get_search_index(self) -> SearchIndex:
+        """The search index for the current tree version."""
+        if self._search_index_version != self.tree_version:
+            self._search_index = SearchIndex(self.shortcuts)
+            self._search_index_version = self.tree_version
+        return self._search_index
     
-    def save_shortcuts(self):
-        """Save shortcuts to config."""
-        config_manager.save_shortcuts(self.shortcuts)
+    def save_shortcuts(self, ops: Optional[List[dict]] = None):
+        """Save shortcuts to config, on the background writer thread.
+
+        ops describes the edit for journaled saves (utils/journal.py);
+        without them the whole tree is written. Failures are shown by
+        _drain_save_errors once the writer reports them."""
+        config_manager.save_shortcuts_async(self.shortcuts, ops)
+        if self._save_watch is None:
+            self._save_watch = self.root.after(SAVE_POLL_MS, self._drain_save_errors)
+
+    def _drain_save_errors(self):
+        """Show any failed background saves; keep polling while saves are queued."""
+        self._save_watch = None
+        while True:
+            try:
+                error = config_manager.save_errors.get_nowait()
+            except queue.Empty:
+                break
+            messagebox.showerror("Save Error", error)
+        if config_manager.pending_saves():
+            self._save_watch = self.root.after(SAVE_POLL_MS, self._drain_save_errors)
 
     def refresh_shortcuts(self):
         """Reload shortcuts from config."""
         clear_validity_cache()
         self.load_shortcuts()
-        self.render_items()
+        self.request_render()
     
     def _create_ui(self):
         """Create the main UI."""
@@ -175,21 +267,29 @@ class MainWindow:
         self.canvas.pack(fill='both', expand=True, padx=20, pady=(0, 20))
         
         # Scrollbar
-        scrollbar = tk.Scrollbar(self.root, orient='vertical',
-                                command=self.canvas.yview)
-        scrollbar.pack(side='right', fill='y', padx=(0, 20))
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = tk.Scrollbar(self.root, orient='vertical',
+                                      command=self.canvas.yview)
+        self.scrollbar.pack(side='right', fill='y', padx=(0, 20))
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
         
-        # Frame for items
-        self.item_frame = tk.Frame(self.canvas, bg=COLORS['dark_gray'])
-        self.canvas_window = self.canvas.create_window((0, 0), 
-                                                      window=self.item_frame,
-                                                      anchor='nw')
+        # Tiles are items on self.canvas: a WindowTile per tile, or with
+        # "renderer": "canvas" tiles drawn straight onto it. There is no
+        # frame the height of the grid - X11 window geometry is 16-bit,
+        # and a 5,000-item folder is some 90,000px tall.
+        self.canvas_tiles: Optional[CanvasTiles] = None
+        if config_manager.settings.get('renderer') == 'canvas':
+            self.canvas_tiles = CanvasTiles(self.canvas,
+                                            on_click=self.on_item_click,
+                                            on_double_click=self.on_item_double_click,
+                                            on_right_click=self.on_item_right_click)
+
+        cache_size = max(0, int(config_manager.settings.get(
+            'view_cache_size', VIEW_CACHE_SIZE)))
+        self._views = ViewCache(cache_size, self._place_tile)
         
-        # Configure scrolling
-        self.item_frame.bind('<Configure>', self._on_frame_configure)
+        # Configure scrolling (the scroll region is set by render_items)
         self.canvas.bind('<Configure>', self._on_canvas_configure)
-    
+
     def _make_button(self, parent, text, bg, command):
         """Create a standard button."""
         return tk.Button(parent, text=text, bg=bg, fg=COLORS['white'],
@@ -229,18 +329,68 @@ class MainWindow:
             bind_unlocked(f'<Key-{digit}>',
                           lambda e, d=digit: self._on_digit_key(d))
     
+    def request_render(self):
+        """Ask for a render on the next idle turn.
+
+        Handlers call this rather than render_items(), so a handler that
+        changes several things (close search, change folder, edit...)
+        rebuilds the grid once, not once per change."""
+        if self._render_request is not None:
+            self.renders_coalesced += 1
+            logger.debug(f"Render coalesced ({self.renders_coalesced} so far)")
+            return
+        self._render_request = self.root.after_idle(self._run_render_request)
+
+    def _run_render_request(self):
+        self._render_request = None
+        self.render_items()
+
     def render_items(self):
-        """Render the current items."""
-        # Clear existing
-        for widget in self.item_frame.winfo_children():
-            widget.destroy()
+        """Render the current items now (most callers want request_render()).
+
+        The grid is virtual: the scroll region is sized from the item
+        count, and tiles exist only for the rows in (or just outside) the
+        viewport - see _layout_visible(). Opening a folder of 5,000
+        shortcuts costs the same as one of 50.
+        """
+        if self._render_request is not None:
+            # This render covers any pending request
+            self.root.after_cancel(self._render_request)
+            self._render_request = None
+
+        self.width_cols = self._grid_columns()
 
+        if self.locked:
+            view_key = ('locked',)
+        elif self.search_active and self.search_query:
+            view_key = ('search', self.search_query)
+        else:
+            view_key = ('folder',) + tuple(self.current_path)
+
+        restored, top = False, None
+        if view_key != self._view_key:
+            # A different view: park the old one if it's a folder, bring
+            # this one back if it's cached, otherwise start at the top
+            restored, top = self._switch_view(view_key)
+            self._view_key = view_key
+        if not restored:
+            # A re-render of the same view (after an edit) keeps its
+            # scroll position but rebinds every tile
+            self._release_tiles(self._tile_at)
+            self._view_items = [] if self.locked else self._get_items_to_show()
+        self._resolve_selection()
+
+        self._update_scroll_region()
+        if top is not None:
+            self.canvas.yview_moveto(top)
         if self.locked:
             self.breadcrumb.config(text="LOCKED - Ctrl+U to unlock")
             return
+        self._update_breadcrumb()
+        self._layout_visible()
 
-        items_to_show = self._get_items_to_show()
-
+    def _grid_columns(self) -> int:
+        """Tile columns that fit the window's current width."""
         # Get the width of the actual window
         root_window_width = self.root.winfo_width()
 
@@ -249,41 +399,213 @@ class MainWindow:
             root_window_width = self.width_hq
 
         multiplier = int(root_window_width) / WINDOW_WIDTH
-        self.width_cols = int(multiplier * ICON_GRID_COLUMNS)
-        
-        # Create grid
-        row, col = 0, 0
-        for name, item, path in items_to_show:
-            widget = IconWidget(self.item_frame, item, path,
-                              on_click=self.on_item_click,
-                              on_double_click=self.on_item_double_click,
-                              on_right_click=self.on_item_right_click)
-            widget.grid(row=row, column=col, padx=10, pady=10, sticky='n')
-            
-            col += 1
+        return max(1, int(multiplier * ICON_GRID_COLUMNS))
+
+    def _switch_view(self, key) -> Tuple[bool, float]:
+        """Swap the current view out and key's view in.
+
+        Returns (restored, top): restored is True if key's view came back
+        from the cache with its tiles still built, False if a blank view
+        was set up for render_items to fill; top is the scroll position
+        to return to once the scroll region is set."""
+        self._render_gen += 1  # queued chunks belong to the old view
+        if self._render_job is not None:
+            self.root.after_cancel(self._render_job)
+            self._render_job = None
+
+        current = GridView(self._view_items, self._tile_at, self._spare,
+                           self.width_cols, self.canvas.yview()[0])
+        old_key = self._view_key
+        self._views.park(old_key[1:] if old_key and old_key[0] == 'folder' else None,
+                         current)
+        view = self._views.take(key[1:] if key[0] == 'folder' else None)
+
+        restored = view is not None
+        if view is None:
+            view = self._views.new_view(self.width_cols)
+        self._view_items, self._tile_at, self._spare = view.items, view.tile_at, view.spare
+        # Puts each tile back in its cell at today's width, which may not
+        # be the width the view was parked at
+        self._views.show(view)
+        if restored:
+            logger.debug(f"View cache hit: {'/'.join(key[1:]) or 'HOME'}")
+        return restored, view.top
+
+    def _update_scroll_region(self):
+        """Size the scroll region from the item count."""
+        rows = -(-len(self._view_items) // self.width_cols)
+        height = rows * TILE_CELL_HEIGHT
+        width = self.width_cols * TILE_CELL_WIDTH
+        self.canvas.configure(scrollregion=(0, 0, width, height))
+
+    def _visible_range(self) -> Tuple[int, int]:
+        """[first, last) item indices of the rows in view, plus overscan."""
+        top = self.canvas.canvasy(0)
+        height = self.canvas.winfo_height()
+        if height <= 1:  # not mapped yet
+            height = self.height_hq
+        first_row = max(0, int(top // TILE_CELL_HEIGHT) - GRID_OVERSCAN_ROWS)
+        last_row = int((top + height) // TILE_CELL_HEIGHT) + 1 + GRID_OVERSCAN_ROWS
+        return (first_row * self.width_cols,
+                min(len(self._view_items), last_row * self.width_cols))
+
+    def _layout_visible(self):
+        """Give every item in the visible range a tile, and only those.
+
+        Tiles for items that scrolled away go back to the spare list; new
+        ones are bound RENDER_CHUNK at a time, the rest from after_idle
+        callbacks so typing and clicks get handled in between. A newer
+        layout abandons any chunks still queued.
+        """
+        self._render_gen += 1
+        if self._render_job is not None:
+            self.root.after_cancel(self._render_job)
+            self._render_job = None
+
+        first, last = self._visible_range()
+        self._release_tiles([i for i in self._tile_at if not first <= i < last])
+        missing = [i for i in range(first, last) if i not in self._tile_at]
+        self._render_chunk(self._render_gen, missing, 0)
+
+    def _render_chunk(self, generation: int, indices: List[int], start: int):
+        """Bind and place one chunk of tiles, then queue the next."""
+        self._render_job = None
+        if generation != self._render_gen:
+            return  # superseded by a newer layout
+
+        end = min(start + RENDER_CHUNK, len(indices))
+        items = self._view_items
+        for index in indices[start:end]:
+            name, item, path = items[index]
+            if self._spare:
+                widget = self._spare.pop()
+                widget.set_item(item, path)
+            elif self.canvas_tiles is not None:
+                widget = self.canvas_tiles.new_tile(item, path)
+            else:
+                widget = WindowTile(self.canvas, item, path,
+                                    on_click=self.on_item_click,
+                                    on_double_click=self.on_item_double_click,
+                                    on_right_click=self.on_item_right_click)
+            self._tile_at[index] = widget
+            if index == self._selected_index:
+                widget.set_highlighted(True)
+            self._place_tile(widget, index)
+
+        if end < len(indices):
+            self._render_job = self.root.after_idle(
+                self._render_chunk, generation, indices, end)
+            return
 
-            if col >= self.width_cols:
-                col = 0
-                row += 1
-        
-        self._update_breadcrumb()
+        # Done: keep a bounded number of spare tiles for later
+        for widget in self._spare[TILE_POOL_SPARE:]:
+            widget.destroy()
+        del self._spare[TILE_POOL_SPARE:]
+
+        # Once things go quiet, decode the icons the user is likely to
+        # see next, so they paint straight away
+        if self._prefetch_job is not None:
+            self.root.after_cancel(self._prefetch_job)
+        self._prefetch_job = self.root.after(ICON_PREFETCH_DELAY_MS, self._prefetch_icons)
+
+    def _prefetch_icons(self):
+        """Queue icon decoding for the rest of this view and its subfolders.
+
+        Workers take these only after icons a visible tile is waiting
+        for. Collecting stops at ICON_PREFETCH_LIMIT icons, and unopened
+        subfolders are read from their raw dicts (Folder.child_icons), so
+        a big search result doesn't build every folder in it."""
+        self._prefetch_job = None
+        if self._view_key is None or self._view_key[0] == 'locked':
+            return
+        specs = {}  # ordered set
+        def collect(icons):
+            for spec in icons:
+                if icon_manager.is_image(spec):
+                    specs[spec] = None
+                    if len(specs) >= ICON_PREFETCH_LIMIT:
+                        return True
+            return False
+        if not collect(item.icon for _, item, _ in self._view_items):
+            for _, item, _ in self._view_items:
+                if isinstance(item, Folder) and collect(item.child_icons()):
+                    break
+        queued = icon_manager.prefetch(specs)
+        if queued:
+            logger.debug(f"Prefetching {queued} icon(s)")
+
+    def _patch_view(self, changed=()):
+        """Update the grid after an edit to the current folder, in place.
+
+        Tiles whose item is still in the folder keep their widget and
+        just move if the item's position changed; tiles of items listed
+        in changed (edited in place) are rebound; tiles of removed items
+        go back to the pool, and new items get tiles from _layout_visible.
+        Anything but a plain folder view falls back to a full render."""
+        if (self._view_key is None or self._view_key[0] != 'folder'
+                or self._render_request is not None):
+            self.request_render()
+            return
+
+        changed = {id(item) for item in changed}
+        tiles = {id(widget.item): widget for widget in self._tile_at.values()}
+        self._tile_at = {}
+        self._view_items = self._get_items_to_show()
+        self._resolve_selection()
+        self._update_scroll_region()
+
+        first, last = self._visible_range()
+        for index in range(first, last):
+            name, item, path = self._view_items[index]
+            widget = tiles.pop(id(item), None)
+            if widget is None:
+                continue
+            if id(item) in changed:
+                widget.set_item(item, path)
+                widget.set_highlighted(index == self._selected_index)
+            self._tile_at[index] = widget
+            self._place_tile(widget, index)
+        for widget in tiles.values():
+            widget.place_forget()
+            self._spare.append(widget)
+        self._layout_visible()
+
+    def _place_tile(self, widget, index: int):
+        """Put a tile in item index's grid cell."""
+        row, col = divmod(index, self.width_cols)
+        widget.place(x=col * TILE_CELL_WIDTH + 10, y=row * TILE_CELL_HEIGHT + 10)
+
+    def _release_tiles(self, indices):
+        """Hide the tiles at these item indices and return them to the pool."""
+        for index in list(indices):
+            widget = self._tile_at.pop(index)
+            widget.place_forget()
+            self._spare.append(widget)
+
+    def _on_yscroll(self, first, last):
+        """Canvas yscrollcommand: move the scrollbar, then fill the new rows."""
+        self.scrollbar.set(first, last)
+        self._layout_visible()
     
     def _get_items_to_show(self) -> List[Tuple[str, BaseItem, List[str]]]:
         """Get items to display based on current state."""
         items = []
         
         if self.search_active and self.search_query:
-            # Recursive search
-            items = self._search_recursive(self.shortcuts, self.search_query)
+            # Whole-tree search: substring matches in tree order, or the
+            # best fuzzy matches first with "search_mode": "fuzzy"
+            index = self._get_search_index()
+            if config_manager.settings.get('search_mode') == 'fuzzy':
+                items = index.fuzzy_search(self.search_query, SEARCH_RESULT_LIMIT)
+            else:
+                items = index.search(self.search_query)
         else:
             # Current folder view
             folder = self._get_current_folder()
             
             # Add back button
             if self.current_path:
-                back_item = Shortcut(name='..', icon='^', path='')
-                back_item.type = 'up'
-                items.append(('..', back_item, []))
+                items.append(('..', self._back_item, []))
             
             # Add folder items
             if isinstance(folder, dict):
@@ -301,51 +623,7 @@ class MainWindow:
 
     def _get_folder_at(self, path: List[str]):
         """Get the folder container at the given path."""
-        folder = self.shortcuts
-
-        for name in path:
-            if isinstance(folder, dict):
-                item = folder.get(name)
-            else:
-                item = folder.items.get(name)
-            
-            if isinstance(item, Folder):
-                folder = item.items
-            else:
-                break
-        
-        return folder
-    
-    def _search_recursive(self, items, query: str, path: List[str] = None) -> List[Tuple[str, BaseItem, List[str]]]:
-        """Recursively search for items."""
-        if path is None:
-            path = []
-        
-        results = []
-        query_lower = query.lower()
-        
-        # Handle dict or Folder
-        if isinstance(items, dict):
-            item_dict = items
-        elif isinstance(items, Folder):
-            item_dict = items.items
-        else:
-            return results
-        
-        for name, item in item_dict.items():
-            # Check if name matches
-            if query_lower in name.lower():
-                display_name = name
-                if path:
-                    display_name = f"{name} ({' > '.join(path)})"
-                results.append((display_name, item, path.copy()))
-            
-            # Search subfolders
-            if isinstance(item, Folder):
-                sub_results = self._search_recursive(item, query, path + [name])
-                results.extend(sub_results)
-        
-        return results
+        return self._get_index().container(path)
     
     def _update_breadcrumb(self):
         """Update breadcrumb display."""
@@ -356,8 +634,10 @@ class MainWindow:
     
     def on_item_click(self, item: BaseItem, path: List[str]):
         """Handle item click."""
-        self.selected_item = (item, path)
-        self._highlight_selected()
+        for index, widget in self._tile_at.items():
+            if widget.item is item:
+                self._select_index(index)
+                return
     
     def on_item_double_click(self, item: BaseItem, path: List[str]):
         """Handle item double-click."""
@@ -366,13 +646,11 @@ class MainWindow:
         elif isinstance(item, Folder):
             # Navigate to folder
             if self.search_active:
-                self.search_active = False
-                self.search_bar.pack_forget()
-                self.search_query = ""
+                self._close_search()
                 self.current_path = path + [item.name]
             else:
                 self.current_path.append(item.name)
-            self.render_items()
+            self.request_render()
         elif isinstance(item, Shortcut):
             # Check if shortcut is valid before launching
             if is_valid_target(item.path):
@@ -418,14 +696,20 @@ class MainWindow:
             self.search_bar.clear()
             self.search_bar.focus()
         else:
-            self.search_bar.pack_forget()
-            self.search_query = ""
-            self.render_items()
+            self._close_search()
+            self.request_render()
+
+    def _close_search(self):
+        """Leave search mode, dropping any search still waiting to fire."""
+        self.search_active = False
+        self.search_bar.pack_forget()
+        self.search_bar.clear()
+        self.search_query = ""
     
     def on_search(self, query: str):
         """Handle search query change."""
         self.search_query = query
-        self.render_items()
+        self.request_render()
 
     def assign_hotkey(self, digit: str):
         """Bind the selected shortcut to a doubletap of the given digit."""
@@ -508,12 +792,10 @@ class MainWindow:
         if self.locked:
             return
         self.locked = True
-        self.selected_item = None
+        self._select_index(None)
         if self.search_active:
-            self.search_active = False
-            self.search_bar.pack_forget()
-            self.search_query = ""
-        self.render_items()
+            self._close_search()
+        self.request_render()
         logger.info("Screen locked")
 
     def unlock_screen(self):
@@ -532,19 +814,19 @@ class MainWindow:
                 return
 
         self.locked = False
-        self.render_items()
+        self.request_render()
         logger.info("Screen unlocked")
 
     def go_home(self):
         """Navigate to home directory."""
         self.current_path = []
-        self.render_items()
+        self.request_render()
     
     def go_up(self):
         """Navigate up one level."""
         if self.current_path:
             self.current_path.pop()
-            self.render_items()
+            self.request_render()
 
     def substitute_paths_dialog(self):
         """Open dialog for path substitution"""
@@ -578,7 +860,7 @@ class MainWindow:
             if old and new:
                 config_manager.substitute_field(old, new, fieldtype=fieldtype)
                 self.load_shortcuts()
-                self.render_items()
+                self.request_render()
                 messagebox.showinfo("Success", f"Replaced {fieldtype}: '{old}' → '{new}'")
                 dialog.destroy()
                 self.dialog_open = False
@@ -622,9 +904,10 @@ class MainWindow:
                 folder[name] = new_item
             else:
                 folder.items[name] = new_item
-            
-            self.save_shortcuts()
-            self.render_items()
+            self._tree_changed(self.current_path)
+
+            self.save_shortcuts([op_set(self.current_path, name, new_item.to_dict())])
+            self._patch_view()
     
     def edit_item(self, item: BaseItem, parent_path: Optional[List[str]] = None):
         """Edit an item."""
@@ -662,6 +945,9 @@ class MainWindow:
                                        path=path, args=args)
                 del items[old_name]
                 items[name] = new_item
+                ops = [op_delete(parent_path, old_name),
+                       op_set(parent_path, name, new_item.to_dict())]
+                changed = []
             else:
                 # Update item properties
                 item.name = name
@@ -676,8 +962,15 @@ class MainWindow:
                     del items[old_name]
                     items[name] = item
 
-            self.save_shortcuts()
-            self.render_items()
+                fields = {'icon': item.icon}
+                if isinstance(item, Shortcut):
+                    fields.update(path=item.path, args=item.args)
+                ops = [op_edit(parent_path, old_name, name, fields)]
+                changed = [item]
+            self._tree_changed(parent_path)
+
+            self.save_shortcuts(ops)
+            self._patch_view(changed)
     
     def duplicate_item(self, item: BaseItem, parent_path: Optional[List[str]] = None):
         """Duplicate an item."""
@@ -698,9 +991,10 @@ class MainWindow:
         # Deep copy via dict round-trip so folder contents come along too
         new_item = item_from_dict(new_name, item.to_dict())
         items[new_name] = new_item
+        self._tree_changed(parent_path)
 
-        self.save_shortcuts()
-        self.render_items()
+        self.save_shortcuts([op_set(parent_path, new_name, new_item.to_dict())])
+        self._patch_view()
 
         # Offer to edit
         if messagebox.askyesno("Edit Duplicate",
@@ -722,9 +1016,10 @@ class MainWindow:
             folder = self._get_folder_at(parent_path)
             items = folder if isinstance(folder, dict) else folder.items
             items.pop(item.name, None)
+            self._tree_changed(parent_path)
 
-            self.save_shortcuts()
-            self.render_items()
+            self.save_shortcuts([op_delete(parent_path, item.name)])
+            self._patch_view()
     
     def show_properties(self, item: BaseItem):
         """Show item properties."""
@@ -803,54 +1098,92 @@ https://github.com/Bladetrain3r/Magic-Launcher"""
 
     def _navigate(self, direction):
         """Navigate items by direction (-1 for left, 1 for right)"""
-        items = self._get_items_to_show()
-        if not items:
-            return
-        
-        # If nothing selected, pick first or last based on direction
-        if not self.selected_item:
-            index = -1 if direction < 0 else 0
-            name, item, path = items[index]
-            self.selected_item = (item, path)
-            self._highlight_selected()
+        count = len(self._view_items)
+        if not count:
             return
-        
-        # Find current index more efficiently
-        current_item, _ = self.selected_item
-        try:
-            current_index = next(i for i, (_, item, _) in enumerate(items) 
-                               if item == current_item)
+        if self._selected_index is None:
+            # Nothing selected: pick first or last based on direction
+            index = count - 1 if direction < 0 else 0
+        else:
             # Move to next item with wraparound
-            new_index = (current_index + direction) % len(items)
-            name, item, path = items[new_index]
-            self.selected_item = (item, path)
-            self._highlight_selected()
-        except StopIteration:
-            # Current item not found, select first
-            name, item, path = items[0]
-            self.selected_item = (item, path)
-            self._highlight_selected()
-
-    def _highlight_selected(self):
-        """Update visual highlight for selected item"""
-        # Clear all highlights first
-        for widget in self.item_frame.winfo_children():
-            if isinstance(widget, IconWidget):
-                widget.set_highlighted(False)
-        
-        # Highlight the selected one
-        if self.selected_item:
-            current_item, _ = self.selected_item
-            for widget in self.item_frame.winfo_children():
-                if isinstance(widget, IconWidget) and widget.item == current_item:
-                    widget.set_highlighted(True)
-                    break
+            index = (self._selected_index + direction) % count
+        self._select_index(index)
+        self._scroll_into_view(index)
+
+    def _select_index(self, index: Optional[int]):
+        """Select _view_items[index] (None clears) and move the highlight.
+
+        Only the old and new tiles are touched - at most two calls."""
+        old = self._tile_at.get(self._selected_index)
+        if old is not None:
+            old.set_highlighted(False)
+        self._selected_index = index
+        if index is None:
+            self.selected_item = None
+            return
+        name, item, path = self._view_items[index]
+        self.selected_item = (item, path)
+        widget = self._tile_at.get(index)
+        if widget is not None:
+            widget.set_highlighted(True)
+
+    def _resolve_selection(self):
+        """Find the selected item in a freshly built _view_items, by identity.
+
+        A selection that isn't in the new view (another folder, or an item
+        replaced by an edit) is dropped."""
+        if self.selected_item is None:
+            self._selected_index = None
+            return
+        selected = self.selected_item[0]
+        items = self._view_items
+        index = self._selected_index
+        if index is None or index >= len(items) or items[index][1] is not selected:
+            index = next((i for i, (_, item, _) in enumerate(items)
+                          if item is selected), None)
+        self._selected_index = index
+        if index is None:
+            self.selected_item = None
+
+    def _scroll_into_view(self, index: int):
+        """Scroll the grid just enough to show the row holding index."""
+        rows = -(-len(self._view_items) // self.width_cols)
+        y0 = (index // self.width_cols) * TILE_CELL_HEIGHT
+        y1 = y0 + TILE_CELL_HEIGHT
+        top = self.canvas.canvasy(0)
+        height = self.canvas.winfo_height()
+        total = rows * TILE_CELL_HEIGHT
+        if y0 < top:
+            self.canvas.yview_moveto(y0 / total)
+        elif y1 > top + height:
+            self.canvas.yview_moveto((y1 - height) / total)
 
-    def _on_frame_configure(self, event):
-        """Configure canvas scroll region."""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-    
     def _on_canvas_configure(self, event):
-        """Configure canvas window width."""
-        canvas_width = event.width
-        self.canvas.itemconfig(self.canvas_window, width=canvas_width)
\ No newline at end of file
+        """Relayout once the resize settles."""
+        # Dragging a window edge sends a stream of these
+        if self._relayout_job is not None:
+            self.root.after_cancel(self._relayout_job)
+        self._relayout_job = self.root.after(RESIZE_DEBOUNCE_MS, self._relayout)
+
+    def _relayout(self):
+        """Re-grid the existing tiles for the window's new column count.
+
+        No tiles are rebuilt: each keeps its item and just moves to its
+        new cell, the scroll region is updated once, and the scroll
+        position follows the first item that was in view."""
+        self._relayout_job = None
+        cols = self._grid_columns()
+        if cols == self.width_cols or self.locked:
+            return
+        first_row = int(self.canvas.canvasy(0) // TILE_CELL_HEIGHT)
+        first_index = first_row * self.width_cols
+
+        self.width_cols = cols
+        for index, widget in self._tile_at.items():
+            self._place_tile(widget, index)
+        self._update_scroll_region()
+        rows = -(-len(self._view_items) // cols)
+        if rows:
+            self.canvas.yview_moveto((first_index // cols) / rows)
+        self._layout_visible()
+        logger.debug(f"Relayout to {cols} columns")
\ No newline at end of file
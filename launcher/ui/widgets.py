@@ -1,17 +1,90 @@
 """UI widgets for the launcher."""
 
+import time
 import tkinter as tk
+from concurrent.futures import Future
 from typing import Callable, Optional, List
 
-from constants import COLORS, ICON_SIZE, LABEL_BASE_WIDTH
+from constants import (COLORS, ICON_SIZE, LABEL_BASE_WIDTH, SEARCH_DEBOUNCE_MS,
+                       VALIDATE_POLL_MS, VALIDATE_TIMEOUT)
 from models import BaseItem, Folder, Shortcut
 from utils.icons import icon_manager
-from utils.launcher import is_valid_target
+from utils.launcher import cached_validity, check_target_async
 from utils.logger import logger
 
 
+class PendingResult:
+    """A background job's Future, polled from the Tk thread with after().
+
+    Calls on_result(result) on the Tk thread once the job is done, or
+    gives up quietly after VALIDATE_TIMEOUT seconds (a hung mount), in
+    which case the tile just keeps what it shows - target "unknown", or
+    its text icon."""
+
+    def __init__(self, widget: tk.Misc, future: Future, on_result: Callable):
+        self.widget = widget
+        self.future = future
+        self.on_result = on_result
+        self.deadline = time.monotonic() + VALIDATE_TIMEOUT
+        self.job = widget.after(VALIDATE_POLL_MS, self._poll)
+
+    def _poll(self):
+        self.job = None
+        if self.future.done():
+            self.on_result(self.future.result())
+        elif time.monotonic() < self.deadline:
+            self.job = self.widget.after(VALIDATE_POLL_MS, self._poll)
+        else:
+            logger.debug("Background tile update timed out, leaving tile as is")
+
+    def cancel(self):
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+
+
+def watch_target(tile, item: BaseItem) -> Optional[PendingResult]:
+    """Show item's target state on tile via tile.set_broken().
+
+    Known answers apply at once. Otherwise the tile is set to unknown
+    (None) and a PendingResult patches the red X in when the background
+    check answers (None if it's overdue: unknown stays); the caller
+    keeps it to cancel on rebind."""
+    if not (isinstance(item, Shortcut) and item.path):
+        tile.set_broken(False)
+        return None
+    valid = cached_validity(item.path)
+    if valid is not None:
+        tile.set_broken(not valid)
+        return None
+    tile.set_broken(None)
+    return PendingResult(tile.tk_widget, check_target_async(item.path),
+                         lambda valid: tile.set_broken(None if valid is None else not valid))
+
+
+def watch_icon(tile, item: BaseItem) -> Optional[PendingResult]:
+    """Show item's icon on tile via tile.set_image().
+
+    An image that's already decoded applies at once. Otherwise the tile
+    shows its text icon while a worker decodes, and a PendingResult
+    swaps the image in when it's ready; the caller keeps it to cancel
+    on rebind."""
+    image = icon_manager.cached_icon(item.icon)
+    tile.set_image(image)
+    if image is not None or not icon_manager.is_image(item.icon):
+        return None
+    icon = item.icon
+    return PendingResult(tile.tk_widget, icon_manager.load_async(icon),
+                         lambda _: tile.set_image(icon_manager.cached_icon(icon)))
+
+
 class IconWidget(tk.Frame):
-    """Widget displaying a single launcher icon."""
+    """Widget displaying a single launcher icon.
+
+    Widgets are pooled by MainWindow: set_item() rebinds an existing
+    widget to a different item by reconfiguring its colours, image and
+    text, which is far cheaper than building a new set of Tk windows.
+    """
     
     def __init__(self, parent, item: BaseItem, path: List[str] = None,
                  on_click: Callable = None, on_double_click: Callable = None,
@@ -19,59 +92,92 @@ class IconWidget(tk.Frame):
         super().__init__(parent, bg=COLORS['dark_gray'], width=120, height=140)
         self.pack_propagate(False)
         
-        self.item = item
-        self.path = path or []
         self.on_click = on_click
         self.on_double_click = on_double_click
         self.on_right_click = on_right_click
+        self.overlay = None  # broken-target X, created on first need
+        self.target_state = 'unknown'  # 'ok', 'broken' or 'unknown'
+        self._target_check: Optional[PendingResult] = None
+        self._icon_load: Optional[PendingResult] = None
+        self.tk_widget = self  # what PendingResult schedules after() on
         
         self._create_widgets()
         self._bind_events()
+        self.set_item(item, path)
     
     def _create_widgets(self):
-        """Create the icon and label."""
+        """Create the icon box and labels (contents come from set_item)."""
         # Icon box
-        icon_color = COLORS['yellow'] if isinstance(self.item, Folder) else COLORS['light_gray']
-        self.icon_box = tk.Frame(self, bg=icon_color, width=ICON_SIZE, height=ICON_SIZE,
+        self.icon_box = tk.Frame(self, bg=COLORS['light_gray'], width=ICON_SIZE, height=ICON_SIZE,
                                 relief='raised', bd=3, highlightthickness=0)
         self.icon_box.pack(pady=(10, 5))
         self.icon_box.pack_propagate(False)
-        
-        # Try to load image icon
-        icon_image = icon_manager.get_icon(self.item.icon)
-        
-        if icon_image:
-            self.icon_label = tk.Label(self.icon_box, image=icon_image, 
-                                      bg=icon_color, bd=0)
-            self.icon_label.image = icon_image  # Keep reference
-        else:
-            # Text icon
-            icon_text = self.item.icon[:2] if len(self.item.icon) <= 2 else self.item.name[0].upper()
-            self.icon_label = tk.Label(
-            self.icon_box, 
-            text=icon_text, 
-            bg=icon_color,
-            font=('DejaVu Sans Mono', 36, 'bold')  # Default font if available
-            )
-        
+
+        # One label shows either the image or the text icon
+        self.icon_label = tk.Label(self.icon_box, bd=0,
+                                   font=('DejaVu Sans Mono', 36, 'bold'))  # Default font if available
         self.icon_label.place(relx=0.5, rely=0.5, anchor='center', width=ICON_SIZE-8, height=ICON_SIZE-8)
-        # Check if shortcut is broken and add red X overlay
-        if isinstance(self.item, Shortcut) and self.item.path:
-            if not is_valid_target(self.item.path):
-                self._add_broken_overlay()
+
+        # Name label
+        self.name_label = tk.Label(self, bg=COLORS['blue'],
+                                  fg=COLORS['white'], font=('DejaVu Sans Mono', 10),
+                                  anchor='center')
+        self.name_label.pack()
+
+    def set_item(self, item: BaseItem, path: List[str] = None):
+        """Show a (possibly different) item in this widget."""
+        self.item = item
+        self.path = path or []
+
+        icon_color = COLORS['yellow'] if isinstance(item, Folder) else COLORS['light_gray']
+        self.icon_box.config(bg=icon_color, relief='raised')
+        self.icon_label.configure(bg=icon_color)
+
+        # Image icons are decoded in the background; the text icon
+        # stands in until the image arrives
+        if self._icon_load is not None:
+            self._icon_load.cancel()
+        self._icon_load = watch_icon(self, item)
+        self.set_highlighted(False)
+
+        # Red X for broken shortcuts - checked in the background, so a
+        # target on a sleeping mount can't hold up the grid
+        if self._target_check is not None:
+            self._target_check.cancel()
+        self._target_check = watch_target(self, item)
 
         # Get label width based on name length
-        name_len = len(self.item.name)
+        name_len = len(item.name)
         if name_len >= 12:
             label_width = LABEL_BASE_WIDTH * 2
         else:
             label_width = LABEL_BASE_WIDTH
+        self.name_label.configure(text=item.name, width=label_width)
 
-        # Name label
-        self.name_label = tk.Label(self, text=self.item.name, bg=COLORS['blue'], 
-                                  fg=COLORS['white'], font=('DejaVu Sans Mono', 10), 
-                                  width=label_width, anchor='center')
-        self.name_label.pack()
+    def set_image(self, icon_image: Optional[tk.PhotoImage]):
+        """Show an image icon, or the item's text icon for None."""
+        if icon_image:
+            self.icon_label.configure(image=icon_image, text='')
+        else:
+            # Text icon
+            item = self.item
+            icon_text = item.icon[:2] if len(item.icon) <= 2 else item.name[0].upper()
+            self.icon_label.configure(image='', text=icon_text)
+        self.icon_label.image = icon_image  # Keep reference
+
+    def set_broken(self, broken: Optional[bool]):
+        """Show or hide the red X; None means not known yet (no X)."""
+        self.target_state = {True: 'broken', False: 'ok', None: 'unknown'}[broken]
+        if broken:
+            self._add_broken_overlay()
+        elif self.overlay is not None:
+            self.overlay.place_forget()
+
+    def destroy(self):
+        for pending in (self._target_check, self._icon_load):
+            if pending is not None:
+                pending.cancel()
+        super().destroy()
 
     def set_highlighted(self, highlighted: bool):
         """Set highlight state"""
@@ -89,6 +195,10 @@ class IconWidget(tk.Frame):
     
     def _add_broken_overlay(self):
         """Add a red X overlay for broken shortcuts."""
+        if self.overlay is not None:
+            self.overlay.place(relx=0.5, rely=0.5, anchor='center')
+            return
+
         # Create red X using canvas
         self.overlay = tk.Canvas(self.icon_box, width=ICON_SIZE-6, height=ICON_SIZE-6,
                            bg=self.icon_box['bg'], highlightthickness=0)
@@ -109,28 +219,20 @@ class IconWidget(tk.Frame):
         self.overlay.tag_lower('all')  # Put behind text but in front of background
         
         # Bind events to overlay too
-        self.overlay.bind('<ButtonPress-1>', self._on_press)
-        self.overlay.bind('<ButtonRelease-1>', self._on_release)
-        self.overlay.bind('<Double-Button-1>', self._on_double_click)
-        self.overlay.bind('<Button-3>', self._on_right_click)
-        self.overlay.bind('<Enter>', self._on_enter)
-        self.overlay.bind('<Leave>', self._on_leave)
+        self._bind_widget(self.overlay)
     
     def _bind_events(self):
         """Bind mouse events."""
-        widgets = [self, self.icon_box, self.icon_label, self.name_label]
-        
-        # Also bind to overlay if it exists
-        if hasattr(self, 'overlay'):
-            widgets.append(self.overlay)
-        
-        for widget in widgets:
-            widget.bind('<ButtonPress-1>', self._on_press)
-            widget.bind('<ButtonRelease-1>', self._on_release)
-            widget.bind('<Double-Button-1>', self._on_double_click)
-            widget.bind('<Button-3>', self._on_right_click)
-            widget.bind('<Enter>', self._on_enter)
-            widget.bind('<Leave>', self._on_leave)
+        for widget in (self, self.icon_box, self.icon_label, self.name_label):
+            self._bind_widget(widget)
+
+    def _bind_widget(self, widget):
+        widget.bind('<ButtonPress-1>', self._on_press)
+        widget.bind('<ButtonRelease-1>', self._on_release)
+        widget.bind('<Double-Button-1>', self._on_double_click)
+        widget.bind('<Button-3>', self._on_right_click)
+        widget.bind('<Enter>', self._on_enter)
+        widget.bind('<Leave>', self._on_leave)
     
     def _on_press(self, event):
         self.icon_box.config(relief='sunken')
@@ -155,14 +257,58 @@ class IconWidget(tk.Frame):
         self.icon_box.config(relief='raised')
 
 
+class WindowTile(IconWidget):
+    """An IconWidget that is its own window item on the grid canvas.
+
+    place() and place_forget() move and hide that canvas item instead of
+    using the place geometry manager. Canvas coordinates are floats and
+    Tk maps only the windows in view, relative to the viewport, so a
+    tile 90,000px down a big folder never needs an X11 window position
+    past 32,767 - as it would placed inside one tall frame.
+    """
+
+    def __init__(self, canvas: tk.Canvas, item: BaseItem, path: List[str] = None,
+                 on_click: Callable = None, on_double_click: Callable = None,
+                 on_right_click: Callable = None):
+        self.canvas = canvas
+        self.window_item = None  # made by the first place()
+        super().__init__(canvas, item, path, on_click=on_click,
+                         on_double_click=on_double_click,
+                         on_right_click=on_right_click)
+
+    def place(self, x: int = 0, y: int = 0, **kwargs):
+        """Move the tile's top-left corner to (x, y) and show it."""
+        if self.window_item is None:
+            self.window_item = self.canvas.create_window(x, y, window=self, anchor='nw')
+        else:
+            self.canvas.coords(self.window_item, x, y)
+            self.canvas.itemconfigure(self.window_item, state='normal')
+
+    def place_forget(self):
+        if self.window_item is not None:
+            self.canvas.itemconfigure(self.window_item, state='hidden')
+
+    def destroy(self):
+        if self.window_item is not None:
+            self.canvas.delete(self.window_item)
+            self.window_item = None
+        super().destroy()
+
+
 class SearchBar(tk.Frame):
-    """Search bar widget."""
+    """Search bar widget.
+
+    on_search is debounced: a burst of keystrokes produces one call,
+    SEARCH_DEBOUNCE_MS after the last one, and only if the text changed.
+    """
     
     def __init__(self, parent, on_search: Callable = None):
         super().__init__(parent, bg=COLORS['black'], highlightthickness=2, 
                         highlightbackground=COLORS['white'])
         
         self.on_search = on_search
+        self._pending = None  # after() id of the scheduled search
+        self._last_query = None
         self._create_widgets()
     
     def _create_widgets(self):
@@ -173,7 +319,19 @@ class SearchBar(tk.Frame):
         self.entry.pack(padx=5, pady=5)
         
         if self.on_search:
-            self.entry.bind('<KeyRelease>', lambda e: self.on_search(self.get_query()))
+            self.entry.bind('<KeyRelease>', self._schedule_search)
+
+    def _schedule_search(self, event=None):
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+        self._pending = self.after(SEARCH_DEBOUNCE_MS, self._fire_search)
+
+    def _fire_search(self):
+        self._pending = None
+        query = self.get_query()
+        if query != self._last_query:
+            self._last_query = query
+            self.on_search(query)
     
     def get_query(self) -> str:
         """Get current search query."""
@@ -181,6 +339,10 @@ class SearchBar(tk.Frame):
     
     def clear(self):
         """Clear search query."""
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._pending = None
+        self._last_query = None
         self.entry.delete(0, 'end')
     
     def focus(self):
@@ -0,0 +1,134 @@
+"""Ranked fuzzy matching for launcher search.
+
+"dmu" finds "Doom Music": the query only has to appear in order, not
+contiguously. Matches are scored so the tile you meant comes first -
+letters that start a word or continue a run score high, gaps cost a
+little - and only the best K are kept, via a bounded heap.
+
+Pure stdlib and no launcher imports, so mlmenu can borrow it from a
+sibling checkout without pulling in Tk, PIL or the logger.
+"""
+
+import heapq
+import re
+from typing import Iterable, List, Optional, Sequence
+
+# Characters after which a letter counts as a word start
+WORD_BREAKS = ' _-./\\()[]+'
+
+MATCH = 1
+WORD_START_BONUS = 8
+FIRST_CHAR_BONUS = 4
+RUN_BONUS = 6
+GAP_PENALTY = 1
+MAX_GAP_PENALTY = 3
+MAX_STARTS = 4  # alignments tried, one per occurrence of the first letter
+
+
+def subsequence_pattern(query: str):
+    """A compiled regex that finds names containing query's letters in order.
+
+    Used as a C-speed prefilter so only real matches get scored."""
+    return re.compile('.*?'.join(re.escape(ch) for ch in query), re.DOTALL)
+
+
+def _is_word_start(text: str, j: int) -> bool:
+    return j == 0 or text[j - 1] in WORD_BREAKS
+
+
+def _fits(query: str, k: int, text: str, pos: int) -> bool:
+    """Whether query[k:] still appears in order in text[pos:]."""
+    for ch in query[k:]:
+        pos = text.find(ch, pos)
+        if pos < 0:
+            return False
+        pos += 1
+    return True
+
+
+def _score_from(query: str, text: str, start: int) -> Optional[int]:
+    score = 0
+    prev = start - 1
+    pos = start
+    for k, ch in enumerate(query):
+        j = text.find(ch, pos)
+        if j < 0:
+            return None
+        if j > start and j != prev + 1 and not _is_word_start(text, j):
+            # A mid-word letter: jump to a later word start with the same
+            # letter if the rest of the query still fits after it
+            w = text.find(ch, j + 1)
+            while w >= 0 and not _is_word_start(text, w):
+                w = text.find(ch, w + 1)
+            if w >= 0 and _fits(query, k + 1, text, w + 1):
+                j = w
+        score += MATCH
+        if j == 0:
+            score += WORD_START_BONUS + FIRST_CHAR_BONUS
+        elif _is_word_start(text, j):
+            score += WORD_START_BONUS
+        if j == prev + 1 and prev >= start:
+            score += RUN_BONUS
+        elif prev >= start:
+            score -= min(j - prev - 1, MAX_GAP_PENALTY) * GAP_PENALTY
+        prev = j
+        pos = j + 1
+    return score
+
+
+def fuzzy_score(query: str, text: str) -> Optional[int]:
+    """Score text against query (both already lowercased).
+
+    None if query's letters don't all appear in text, in order. Tries
+    a few alignments (each early occurrence of the first letter) and
+    keeps the best, so "dm" prefers "Doom Music" over the m in "Doom".
+    """
+    if not query:
+        return 0
+    # Fast path: the query as one run starting a word is as good a
+    # match as a name gets, and it's the common case while typing
+    j = text.find(query)
+    if j >= 0 and _is_word_start(text, j):
+        return (len(query) * MATCH + WORD_START_BONUS
+                + (FIRST_CHAR_BONUS if j == 0 else 0)
+                + (len(query) - 1) * RUN_BONUS)
+    best = None
+    start = text.find(query[0])
+    tries = 0
+    while start >= 0 and tries < MAX_STARTS:
+        score = _score_from(query, text, start)
+        if score is None:
+            break  # a later start can't match if this one didn't
+        if best is None or score > best:
+            best = score
+        start = text.find(query[0], start + 1)
+        tries += 1
+    return best
+
+
+def matching(query: str, names: Sequence[str],
+             candidates: Optional[Iterable[int]] = None) -> List[int]:
+    """Indices of names (lowercased) that contain query's letters in order.
+
+    candidates restricts the check to some indices - e.g. the matches of
+    a shorter query, since "dmu" can only match where "dm" did."""
+    found = subsequence_pattern(query.lower()).search
+    if candidates is None:
+        candidates = range(len(names))
+    return [i for i in candidates if found(names[i])]
+
+
+def rank(query: str, names: Sequence[str], ids: Iterable[int],
+         limit: int = 50) -> List[int]:
+    """The best `limit` of ids (already known to match), best first.
+
+    Scores stream through heapq.nlargest, so only `limit` results are
+    ever held. Ties go to the shorter name, then to the earlier one."""
+    query = query.lower()
+    scored = ((fuzzy_score(query, names[i]), -len(names[i]), -i) for i in ids)
+    return [-i for _, _, i in heapq.nlargest(limit, scored)]
+
+
+def top_matches(query: str, names: Sequence[str], limit: int = 50) -> List[int]:
+    """Indices into names (lowercased) of the best fuzzy matches, best first."""
+    return rank(query, names, matching(query, names), limit)
@@ -1,10 +1,34 @@
-"""Icon loading and caching utilities."""
+"""Icon loading and caching utilities.
 
-from pathlib import Path
-from typing import Optional, Dict
+Icons are BMPs of any size, shown at 64x64. Scaling them takes PIL and
+a full decode of the source, so each icon is scaled once and the result
+kept in ICON_THUMBS_DIR as a file Tk reads by itself - PPM, or PNG for
+icons with transparency. The thumbnail's name carries the source's
+mtime, size and the target size, so editing or replacing an icon (or
+changing icon_size) just misses and writes a new one.
+
+In memory, decoded PhotoImages are kept in an LRU of ICON_CACHE_SIZE,
+with hit/miss counters for tuning. A tile holds its own reference to
+its image, so evicting one that's on screen is harmless.
+
+Scaling (or finding the thumbnail) runs on worker threads: tiles show
+their text icon, ask load_async() and swap the image in when it's
+ready, and the only work left on the Tk thread is making the
+PhotoImage. prefetch() queues icons behind those tiles are waiting for.
+"""
+
+import itertools
+import os
+import queue
 import shutil
+import threading
+import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
 
-from constants import ICONS_DIR
+from constants import ICONS_DIR, ICON_THUMBS_DIR, ICON_CACHE_SIZE
 from utils.logger import logger
 
 # Try to import PIL
@@ -13,72 +37,211 @@ try:
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
-    logger.warning("PIL not available - BMP icons disabled")
+    logger.warning("PIL not available - BMP icons limited to already-cached thumbnails")
+
+
+ICON_WORKERS = 2
 
 
 class IconManager:
     """Manages icon loading and caching."""
-    
-    def __init__(self):
-        self.cache: Dict[str, 'ImageTk.PhotoImage'] = {}
+
+    def __init__(self, max_cached: int = ICON_CACHE_SIZE):
+        self.cache: 'OrderedDict[str, tk.PhotoImage]' = OrderedDict()
+        self.max_cached = max_cached
         self.icon_size = (64, 64)  # Default icon size
-    
-    def get_icon(self, icon_spec: str) -> Optional['ImageTk.PhotoImage']:
+        self.hits = 0
+        self.misses = 0
+        # Decoding happens on ICON_WORKERS daemon threads; _loads holds
+        # each icon's pending or finished (not yet built) load
+        self._loads: Dict[str, Future] = {}
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._order = itertools.count()  # FIFO within a priority
+        self._workers = []
+        self._lock = threading.Lock()
+
+    def get_icon(self, icon_spec: str) -> Optional[tk.PhotoImage]:
         """
-        Load an icon from specification.
-        
-        Returns PhotoImage for BMP files, None for text icons.
+        Load an icon from specification, decoding it here if need be.
+
+        Returns PhotoImage for BMP files, None for text icons. The UI
+        uses cached_icon() and load_async() instead, so that decoding
+        happens on a worker thread.
         """
-        if not icon_spec or not PIL_AVAILABLE:
+        photo = self.cached_icon(icon_spec)
+        if photo is None and self.is_image(icon_spec):
+            photo = self._build(icon_spec, self._load(icon_spec))
+        return photo
+
+    @staticmethod
+    def is_image(icon_spec: str) -> bool:
+        """Whether icon_spec names an image file (only BMPs) or is a text icon."""
+        return bool(icon_spec) and icon_spec.endswith('.bmp')
+
+    def cached_icon(self, icon_spec: str) -> Optional[tk.PhotoImage]:
+        """The icon if it's ready without decoding anything, else None.
+
+        Ready means in the memory cache, or decoded by a worker and only
+        waiting for its (cheap) PhotoImage, which is made here - so this
+        must be called on the Tk thread."""
+        if not self.is_image(icon_spec):
             return None
-        
-        # Only handle BMP files
-        if not icon_spec.endswith('.bmp'):
+        photo = self.cache.get(icon_spec)
+        if photo is not None:
+            self.cache.move_to_end(icon_spec)
+            self.hits += 1
+            return photo
+        future = self._loads.get(icon_spec)
+        if future is None or not future.done():
             return None
-        
-        # Check cache first
-        if icon_spec in self.cache:
-            return self.cache[icon_spec]
-        
+        return self._build(icon_spec, future.result())
+
+    def load_async(self, icon_spec: str, prefetch: bool = False) -> Future:
+        """Decode icon_spec on a worker; the Future's result is for cached_icon().
+
+        Prefetches wait behind icons a tile is waiting for, and asking
+        for a queued prefetch without prefetch moves it to the front."""
+        with self._lock:
+            future = self._loads.get(icon_spec)
+            if future is None:
+                future = Future()
+                self._loads[icon_spec] = future
+            elif future.done() or prefetch:
+                return future
+            # New, or a queued prefetch a tile now wants: (re)queue it -
+            # a worker skips entries whose future was already taken
+            self._queue.put((1 if prefetch else 0, next(self._order), icon_spec, future))
+            if len(self._workers) < ICON_WORKERS:
+                worker = threading.Thread(target=self._load_worker,
+                                          name='icons', daemon=True)
+                self._workers.append(worker)
+                worker.start()
+        return future
+
+    def prefetch(self, icon_specs: Iterable[str]) -> int:
+        """Queue decoding of icons that aren't cached yet; returns how many."""
+        queued = 0
+        for spec in icon_specs:
+            if (self.is_image(spec) and spec not in self.cache
+                    and spec not in self._loads):
+                self.load_async(spec, prefetch=True)
+                queued += 1
+        return queued
+
+    def _load_worker(self):
+        while True:
+            _, _, icon_spec, future = self._queue.get()
+            with self._lock:
+                if future.running() or future.done():
+                    continue  # requeued ahead of its prefetch and already done
+                future.set_running_or_notify_cancel()
+            future.set_result(self._load(icon_spec))
+
+    def _load(self, icon_spec: str) -> Union[Path, 'Image.Image', None]:
+        """Everything short of the PhotoImage: the thumbnail file, or the
+        scaled image if it couldn't be written. Safe off the Tk thread."""
         # Try to load from icons directory
         icon_path = ICONS_DIR / icon_spec
-        if icon_path.exists():
-            try:
-                img = Image.open(icon_path)
-                img = img.resize(self.icon_size, Image.NEAREST)
-                photo = ImageTk.PhotoImage(img)
-                self.cache[icon_spec] = photo
-                logger.debug(f"Loaded icon: {icon_spec}")
-                return photo
-            except Exception as e:
-                logger.error(f"Error loading icon {icon_spec}: {e}")
-        
+        try:
+            stat = icon_path.stat()
+        except OSError:
+            return None
+        try:
+            thumb = self._thumbnail(icon_path, stat)
+            if thumb is not None:
+                return thumb
+            if PIL_AVAILABLE:
+                # Thumbnail couldn't be written (read-only config?) - scale in memory
+                return self._scaled(icon_path)
+        except Exception as e:
+            logger.error(f"Error loading icon {icon_spec}: {e}")
         return None
-    
+
+    def _build(self, icon_spec: str, source) -> Optional[tk.PhotoImage]:
+        """Make and cache the PhotoImage for a _load() result (Tk thread)."""
+        if source is None:
+            return None
+        self.misses += 1
+        try:
+            if isinstance(source, Path):
+                photo = tk.PhotoImage(file=str(source))
+            else:
+                photo = ImageTk.PhotoImage(source)
+        except Exception as e:
+            logger.error(f"Error loading icon {icon_spec}: {e}")
+            return None
+        with self._lock:
+            self._loads.pop(icon_spec, None)
+
+        self.cache[icon_spec] = photo
+        while len(self.cache) > self.max_cached:
+            self.cache.popitem(last=False)
+        logger.debug(f"Loaded icon: {icon_spec}")
+        return photo
+
+    def _thumbnail(self, icon_path: Path, stat: os.stat_result) -> Optional[Path]:
+        """The pre-scaled copy of icon_path, made now if it doesn't exist yet."""
+        width, height = self.icon_size
+        key = f"{icon_path.name}.{stat.st_mtime_ns}.{stat.st_size}.{width}x{height}"
+        for suffix in ('.ppm', '.png'):
+            thumb = ICON_THUMBS_DIR / (key + suffix)
+            if thumb.is_file():
+                return thumb
+        if not PIL_AVAILABLE:
+            return None
+
+        img = self._scaled(icon_path)
+        if img.mode in ('RGBA', 'LA') or 'transparency' in img.info:
+            img, suffix = img.convert('RGBA'), '.png'
+        else:
+            img, suffix = img.convert('RGB'), '.ppm'
+        thumb = ICON_THUMBS_DIR / (key + suffix)
+        try:
+            ICON_THUMBS_DIR.mkdir(parents=True, exist_ok=True)
+            # Drop thumbnails of older versions of this icon
+            for old in ICON_THUMBS_DIR.iterdir():
+                if old.name.startswith(icon_path.name + '.') and old.stem.count('.') == key.count('.'):
+                    old.unlink(missing_ok=True)  # another process may beat us
+            temp = thumb.with_name(thumb.name + '.tmp')
+            img.save(temp, format=suffix[1:].upper())
+            os.replace(temp, thumb)
+        except OSError as e:
+            logger.warning(f"Could not cache thumbnail for {icon_path.name}: {e}")
+            return None
+        return thumb
+
+    def _scaled(self, icon_path: Path) -> 'Image.Image':
+        with Image.open(icon_path) as img:
+            return img.resize(self.icon_size, Image.NEAREST)
+
     def copy_icon_to_storage(self, source_path: str) -> Optional[str]:
         """
         Copy an icon file to the icons directory.
-        
+
         Returns the filename if successful, None otherwise.
         """
         source = Path(source_path)
         if not source.exists():
             return None
-        
+
         try:
             dest = ICONS_DIR / source.name
             shutil.copy2(source, dest)
+            # May replace an icon already shown
+            self.cache.pop(source.name, None)
+            with self._lock:
+                self._loads.pop(source.name, None)
             logger.info(f"Copied icon to {dest}")
             return source.name
         except Exception as e:
             logger.error(f"Error copying icon: {e}")
             return None
-    
+
     def clear_cache(self):
-        """Clear the icon cache."""
+        """Clear the in-memory icon cache (thumbnails on disk stay)."""
         self.cache.clear()
         logger.debug("Cleared icon cache")
 
 
 # Global icon manager instance
-icon_manager = IconManager()
\ No newline at end of file
+icon_manager = IconManager()
@@ -0,0 +1,125 @@
+"""A small inotify directory watcher over ctypes - Linux only, no deps.
+
+Used by utils/launcher.py to drop cached target checks the moment a
+file next to a shortcut's target is created, removed or renamed,
+instead of waiting for the cache entry to expire. Anywhere inotify
+isn't available (macOS, Windows, odd libcs) start() returns False and
+the cache carries on with its TTL and directory-mtime checks.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import struct
+import threading
+from typing import Callable, Dict, Optional
+
+from utils.logger import logger
+
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+              | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+_EVENT = struct.Struct('iIII')
+
+
+class DirWatcher:
+    """Watches directories and reports changes from a daemon thread.
+
+    on_change(directory, name) is called for each entry created, deleted,
+    renamed or re-permissioned in a watched directory. name is None when
+    the directory itself went away, and both are None when the kernel
+    dropped events (queue overflow) - then anything may have changed.
+    """
+
+    def __init__(self, on_change: Callable[[Optional[str], Optional[str]], None],
+                 max_watches: int = 1024):
+        self.on_change = on_change
+        self.max_watches = max_watches  # stays well under fs.inotify.max_user_watches
+        self._fd = -1
+        self._libc = None
+        self._lock = threading.Lock()
+        self._wd_dir: Dict[int, str] = {}
+        self._dir_wd: Dict[str, int] = {}
+
+    def start(self) -> bool:
+        """Open inotify and start the reader thread; False if unavailable."""
+        if self._fd >= 0:
+            return True
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6',
+                               use_errno=True)
+            init = libc.inotify_init1
+        except (OSError, AttributeError):
+            return False
+        fd = init(IN_CLOEXEC)
+        if fd < 0:
+            logger.debug(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}")
+            return False
+        self._libc = libc
+        self._fd = fd
+        threading.Thread(target=self._run, name='inotify', daemon=True).start()
+        return True
+
+    def watch(self, directory: str) -> bool:
+        """Start watching directory (no-op if already watched or at the cap)."""
+        if self._fd < 0:
+            return False
+        with self._lock:
+            if directory in self._dir_wd:
+                return True
+            if len(self._dir_wd) >= self.max_watches:
+                return False
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory),
+                                              WATCH_MASK)
+            if wd < 0:
+                return False
+            self._wd_dir[wd] = directory
+            self._dir_wd[directory] = wd
+        return True
+
+    def _run(self):
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except OSError as e:
+                logger.error(f"inotify read failed, watcher stopped: {e}")
+                return
+            offset = 0
+            while offset + _EVENT.size <= len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                raw = data[offset + _EVENT.size:offset + _EVENT.size + length]
+                offset += _EVENT.size + length
+                try:
+                    self._dispatch(wd, mask, os.fsdecode(raw.rstrip(b'\0')))
+                except Exception as e:
+                    logger.error(f"inotify callback failed: {e}")
+
+    def _dispatch(self, wd: int, mask: int, name: str):
+        if mask & IN_Q_OVERFLOW:
+            self.on_change(None, None)
+            return
+        with self._lock:
+            directory = self._wd_dir.get(wd)
+            if mask & IN_IGNORED and directory is not None:
+                # Watch removed by the kernel (directory deleted/unmounted)
+                del self._wd_dir[wd]
+                self._dir_wd.pop(directory, None)
+        if directory is None:
+            return
+        if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+            self.on_change(directory, None)
+        else:
+            self.on_change(directory, name)
@@ -0,0 +1,98 @@
+"""Append-only change journal for shortcuts.json.
+
+With journaled saves on, an edit in the native app appends one small
+JSON line here instead of rewriting the whole config. Every so often
+(and on exit) ConfigManager compacts: shortcuts.json + journal ->
+new shortcuts.json, written atomically, and the journal is removed.
+
+Readers replay the journal on top of the JSON, so they see pending
+edits. A line torn by a crash mid-append is skipped, which loses at
+most that one edit.
+
+Operations, each addressed by the names of the folders above the item
+(`path`, [] for the top level):
+    {"op": "set",    "path": [...], "name": n, "item": {...}}
+    {"op": "delete", "path": [...], "name": n}
+    {"op": "edit",   "path": [...], "name": n, "new_name": m,
+     "fields": {"icon": ..., "path": ..., "args": ...}}
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+from utils.logger import logger
+
+
+def op_set(path: List[str], name: str, item_data: Dict[str, Any]) -> dict:
+    return {'op': 'set', 'path': list(path), 'name': name, 'item': item_data}
+
+
+def op_delete(path: List[str], name: str) -> dict:
+    return {'op': 'delete', 'path': list(path), 'name': name}
+
+
+def op_edit(path: List[str], name: str, new_name: str,
+            fields: Dict[str, Any]) -> dict:
+    return {'op': 'edit', 'path': list(path), 'name': name,
+            'new_name': new_name, 'fields': fields}
+
+
+def append_ops(journal_path: Path, ops: List[dict]):
+    """Append ops as JSON lines and fsync - one small write per edit."""
+    lines = ''.join(json.dumps(op) + '\n' for op in ops)
+    with open(journal_path, 'a', encoding='utf-8') as f:
+        f.write(lines)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_journal(journal_path: Path) -> List[dict]:
+    """All intact ops in the journal, oldest first ([] if there's none)."""
+    try:
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return []
+    except OSError as e:
+        logger.error(f"Error reading journal: {e}")
+        return []
+
+    ops = []
+    for number, line in enumerate(lines, 1):
+        try:
+            op = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"Skipping damaged journal line {number}")
+            continue
+        if isinstance(op, dict):
+            ops.append(op)
+    return ops
+
+
+def apply_ops(data: Dict[str, Any], ops: List[dict]) -> Dict[str, Any]:
+    """Replay ops onto a raw shortcuts dict, in place, and return it.
+
+    An op whose folder no longer exists is skipped with a warning rather
+    than failing the whole load."""
+    for op in ops:
+        container = data
+        try:
+            for seg in op['path']:
+                container = container[seg]['items']
+            name = op['name']
+            kind = op['op']
+            if kind == 'set':
+                container[name] = op['item']
+            elif kind == 'delete':
+                container.pop(name, None)
+            elif kind == 'edit':
+                item = container.pop(name) if op['new_name'] != name else container[name]
+                item.update(op['fields'])
+                container[op['new_name']] = item
+            else:
+                logger.warning(f"Unknown journal op {kind!r}")
+        except (KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Skipping journal op that no longer applies: {op!r} ({e})")
+    return data
@@ -1,45 +1,402 @@
 """Utilities for launching applications and shortcuts."""
 
+import queue
 import subprocess
 import platform
 import os
+import threading
+import time
+from concurrent.futures import Future, wait
 from pathlib import Path
 from shutil import which
-from typing import Optional
+from typing import Dict, FrozenSet, Iterable, NamedTuple, Optional, Set, Tuple
+from utils.inotify import DirWatcher
 from utils.logger import logger
 
 # Cache of path -> validity so re-renders (especially search-as-you-type)
 # don't hit the filesystem or PATH lookup for every icon, every keystroke.
-_validity_cache = {}
+#
+# Entries are trusted for VALIDITY_TTL seconds. After that the next read
+# still gets the cached answer at once, and a worker revalidates: if the
+# target's parent directory has the same mtime, nothing was created,
+# removed or renamed there and the answer stands without touching the
+# target; otherwise it's checked again. On Linux an inotify watcher
+# (utils/inotify.py) also evicts entries as soon as their directory
+# changes. validity_generation() goes up whenever an answer may have
+# changed, so callers can cache anything built from these answers.
+VALIDITY_TTL = 30.0
+
+
+class _Checked(NamedTuple):
+    valid: bool
+    checked_at: float  # time.monotonic()
+    target: Optional[str]  # expanded absolute path; None for URLs/commands
+    dir_mtime: Optional[int]  # target's parent directory st_mtime_ns
+
+
+_validity_cache: Dict[str, _Checked] = {}
+_by_target: Dict[str, Set[str]] = {}  # expanded target -> cached paths
+_generation = 0
+
+# Background checks: daemon workers, so a target on a sleeping network
+# mount stalls a worker rather than the UI, and a check that never
+# returns can't hold up exit the way a ThreadPoolExecutor's (joined at
+# exit) workers would.
+#
+# A check still running after VALIDATE_DEADLINE is overdue: its Future
+# answers None (unknown), the path stays unknown without being queued
+# again until that check does return, and it stops counting against
+# the pool - a replacement worker starts, up to VALIDATE_MAX_WORKERS in
+# all. A few shortcuts on a dead mount then cost a few stuck threads
+# instead of every check for the rest of the tree.
+VALIDATE_WORKERS = 4
+VALIDATE_DEADLINE = 1.0  # seconds before a running check is overdue
+VALIDATE_MAX_WORKERS = 16  # overdue ones included
+_check_queue: queue.Queue = queue.Queue()
+_pending: Dict[str, Future] = {}  # path -> queued or running check
+_running: Dict[str, float] = {}  # path -> when a worker started it
+_overdue: Set[str] = set()  # paths whose check is past the deadline
+_workers = []
+_watchdog: Optional[threading.Thread] = None  # marks overdue checks
+_check_lock = threading.Lock()
+
+
+class PathIndex:
+    """Every command name on $PATH, for set lookups instead of shutil.which.
+
+    Built with one os.scandir per PATH directory. A directory is only
+    scanned again when its mtime changes (something was installed or
+    removed), and the mtimes themselves are re-checked at most every
+    RECHECK_SECONDS, so a page of 500 shortcuts costs a set lookup each.
+    """
+
+    RECHECK_SECONDS = 2.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._path_env = None
+        self._dirs: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+        self._names: FrozenSet[str] = frozenset()
+        self._checked_at = 0.0
+
+    def has(self, cmd: str) -> bool:
+        """Whether cmd (no directory part) is an executable on $PATH."""
+        self._refresh()
+        if os.name == 'nt':
+            cmd = cmd.lower()
+        return cmd in self._names
+
+    def _refresh(self):
+        now = time.monotonic()
+        path_env = os.environ.get('PATH', os.defpath)
+        if path_env == self._path_env and now - self._checked_at < self.RECHECK_SECONDS:
+            return
+        with self._lock:
+            changed = path_env != self._path_env
+            dirs = {}
+            for directory in path_env.split(os.pathsep):
+                if not directory or directory in dirs:
+                    continue
+                try:
+                    mtime = os.stat(directory).st_mtime_ns
+                except OSError:
+                    continue
+                known = self._dirs.get(directory)
+                if known is None or known[0] != mtime:
+                    known = (mtime, self._scan(directory))
+                    changed = True
+                dirs[directory] = known
+            if changed or len(dirs) != len(self._dirs):
+                names = set()
+                for _, found in dirs.values():
+                    names |= found
+                self._names = frozenset(names)
+                logger.debug(f"PATH index: {len(self._names)} commands in {len(dirs)} dirs")
+            self._dirs = dirs
+            self._path_env = path_env
+            self._checked_at = now
+
+    @staticmethod
+    def _scan(directory: str) -> FrozenSet[str]:
+        names = set()
+        if os.name == 'nt':
+            exts = os.environ.get('PATHEXT', '.COM;.EXE;.BAT;.CMD').lower().split(';')
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    if os.name == 'nt':
+                        # which() accepts "notepad" for notepad.exe
+                        name = entry.name.lower()
+                        stem, ext = os.path.splitext(name)
+                        if ext in exts:
+                            names.add(name)
+                            names.add(stem)
+                    elif os.access(entry.path, os.X_OK):
+                        names.add(entry.name)
+        except OSError as e:
+            logger.debug(f"PATH index: can't scan {directory}: {e}")
+        return frozenset(names)
+
+
+_path_index = PathIndex()
 
 
 def is_valid_target(path: str) -> bool:
-    """Check if a shortcut target points at something launchable."""
+    """Check if a shortcut target points at something launchable.
+
+    Blocks on the filesystem for uncached or expired paths; the UI and
+    server use check_target_async() / check_targets() instead."""
     if not path:
         return False
 
-    if path in _validity_cache:
-        return _validity_cache[path]
+    entry = _validity_cache.get(path)
+    if entry is None:
+        entry = _store(path, _check_entry(path))
+    elif time.monotonic() - entry.checked_at >= VALIDITY_TTL:
+        entry = _revalidate(path, entry)
+    return entry.valid
 
-    # URLs are always considered valid (we can't check them quickly)
-    if path.startswith(('http://', 'https://')):
-        valid = True
-    else:
-        expanded = os.path.expanduser(os.path.expandvars(path))
-        if os.path.isabs(expanded):
-            valid = os.path.exists(expanded)
-        else:
-            # Might be a command in PATH
-            cmd = path.split()[0]
-            valid = which(cmd) is not None
 
-    _validity_cache[path] = valid
-    return valid
+def cached_validity(path: str) -> Optional[bool]:
+    """The cached answer for path, or None if it hasn't been checked.
+
+    Never touches the filesystem: an expired answer is still returned,
+    and revalidated in the background for next time."""
+    if not path:
+        return False
+    entry = _validity_cache.get(path)
+    if entry is None:
+        return None
+    if time.monotonic() - entry.checked_at >= VALIDITY_TTL:
+        _submit(path)
+    return entry.valid
+
+
+def check_target_async(path: str) -> Future:
+    """A Future for is_valid_target(path), checked on a worker thread.
+
+    Already-cached paths get a finished Future; a path already being
+    checked shares that check. The result is None (unknown) for a check
+    past VALIDATE_DEADLINE."""
+    valid = cached_validity(path)
+    if valid is not None:
+        future = Future()
+        future.set_result(valid)
+        return future
+    return _submit(path)
+
+
+def check_targets(paths: Iterable[str], timeout: float) -> Dict[str, Optional[bool]]:
+    """Check many paths in parallel, waiting at most timeout seconds overall.
+
+    Maps each path to True/False, or None if its check hasn't answered
+    in time or is overdue (it carries on, and lands in the cache when it
+    does)."""
+    futures = {path: check_target_async(path) for path in set(paths)}
+    wait(list(futures.values()), timeout=timeout)
+    return {path: future.result() if future.done() else None
+            for path, future in futures.items()}
+
+
+def validity_generation() -> int:
+    """A counter that moves whenever a cached answer may have changed."""
+    return _generation
 
 
 def clear_validity_cache():
     """Forget cached path checks (e.g. on config refresh)."""
-    _validity_cache.clear()
+    global _generation
+    with _check_lock:
+        _validity_cache.clear()
+        _by_target.clear()
+        _generation += 1
+
+
+def start_validity_watcher() -> bool:
+    """Evict cached checks on directory changes via inotify (Linux only).
+
+    Optional: returns False where inotify isn't available, and the TTL
+    and mtime revalidation carry on alone."""
+    global _watcher
+    if _watcher is None:
+        watcher = DirWatcher(_on_dir_change)
+        if not watcher.start():
+            return False
+        _watcher = watcher
+        with _check_lock:
+            targets = list(_by_target)
+        for target in targets:
+            watcher.watch(os.path.dirname(target))
+        logger.info("Watching shortcut target directories with inotify")
+    return True
+
+
+_watcher: Optional[DirWatcher] = None
+
+
+def _submit(path: str) -> Future:
+    """Queue a (re)check of path, sharing one already in flight.
+
+    A path whose check is overdue gets an unknown (None) answer at once."""
+    global _watchdog
+    with _check_lock:
+        future = _pending.get(path)
+        if future is None:
+            future = Future()
+            if path in _overdue:
+                future.set_result(None)
+                return future
+            _pending[path] = future
+            _check_queue.put((path, future))
+            _add_workers()
+            if _watchdog is None:
+                _watchdog = threading.Thread(target=_watch_deadlines,
+                                             name='validate-watchdog', daemon=True)
+                _watchdog.start()
+    return future
+
+
+def _add_workers():
+    """Top the pool up to VALIDATE_WORKERS workers not stuck on an
+    overdue check. Called with _check_lock held."""
+    while (len(_workers) - len(_overdue) < VALIDATE_WORKERS
+           and len(_workers) < VALIDATE_MAX_WORKERS):
+        worker = threading.Thread(target=_check_worker,
+                                  name='validate', daemon=True)
+        _workers.append(worker)
+        worker.start()
+
+
+def _watch_deadlines():
+    """Mark running checks overdue once past VALIDATE_DEADLINE; exits
+    when no checks are left queued or running."""
+    global _watchdog
+    while True:
+        time.sleep(VALIDATE_DEADLINE / 4)
+        now = time.monotonic()
+        late = []
+        with _check_lock:
+            for path, started in _running.items():
+                if path not in _overdue and now - started >= VALIDATE_DEADLINE:
+                    _overdue.add(path)
+                    late.append(_pending.pop(path))
+            if late:
+                _add_workers()
+            idle = not _pending
+            if idle:
+                _watchdog = None
+        for future in late:
+            future.set_result(None)
+        if late:
+            logger.warning(f"{len(late)} target check(s) still running after "
+                           f"{VALIDATE_DEADLINE}s, treating as unknown")
+        if idle:
+            return
+
+
+def _check_worker():
+    me = threading.current_thread()
+    while True:
+        path, future = _check_queue.get()
+        with _check_lock:
+            _running[path] = time.monotonic()
+        try:
+            entry = _validity_cache.get(path)
+            if entry is None:
+                entry = _store(path, _check_entry(path))
+            else:
+                entry = _revalidate(path, entry)
+            valid = entry.valid
+        except Exception as e:
+            logger.warning(f"Target check failed for '{path}': {e}")
+            valid = False
+        with _check_lock:
+            del _running[path]
+            if path in _overdue:
+                # Already answered None; the pool replaced this worker,
+                # so it bows out if that leaves enough without it
+                _overdue.discard(path)
+                if len(_workers) - len(_overdue) > VALIDATE_WORKERS:
+                    _workers.remove(me)
+                    return
+                continue
+            del _pending[path]
+        future.set_result(valid)
+
+
+def _revalidate(path: str, entry: _Checked) -> _Checked:
+    """Refresh an expired entry, cheaply if its directory hasn't changed."""
+    if entry.target is not None and entry.dir_mtime is not None:
+        try:
+            unchanged = os.stat(os.path.dirname(entry.target)).st_mtime_ns == entry.dir_mtime
+        except OSError:
+            unchanged = False
+        if unchanged:
+            return _store(path, entry._replace(checked_at=time.monotonic()))
+    return _store(path, _check_entry(path))
+
+
+def _store(path: str, entry: _Checked) -> _Checked:
+    global _generation
+    with _check_lock:
+        old = _validity_cache.get(path)
+        _validity_cache[path] = entry
+        if old is not None and old.valid != entry.valid:
+            _generation += 1
+        if entry.target is not None:
+            _by_target.setdefault(entry.target, set()).add(path)
+    if entry.target is not None and _watcher is not None:
+        _watcher.watch(os.path.dirname(entry.target))
+    return entry
+
+
+def _on_dir_change(directory: Optional[str], name: Optional[str]):
+    """DirWatcher callback: evict just the entries that change could affect."""
+    global _generation
+    with _check_lock:
+        if directory is None:
+            # Events were lost - anything on disk may have changed
+            targets = list(_by_target)
+        elif name is None:
+            prefix = directory.rstrip(os.sep) + os.sep
+            targets = [t for t in _by_target if t.startswith(prefix)]
+        else:
+            target = os.path.join(directory, name)
+            targets = [target] if target in _by_target else []
+        for target in targets:
+            for path in _by_target.pop(target):
+                _validity_cache.pop(path, None)
+        if targets:
+            _generation += 1
+    if targets:
+        logger.debug(f"Target change in {directory}: dropped {len(targets)} cached check(s)")
+
+
+def _check_entry(path: str) -> _Checked:
+    now = time.monotonic()
+    # URLs are always considered valid (we can't check them quickly)
+    if path.startswith(('http://', 'https://')):
+        return _Checked(True, now, None, None)
+    expanded = os.path.expanduser(os.path.expandvars(path))
+    if os.path.isabs(expanded):
+        expanded = os.path.normpath(expanded)
+        try:
+            dir_mtime = os.stat(os.path.dirname(expanded)).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        return _Checked(os.path.exists(expanded), now, expanded, dir_mtime)
+    # Might be a command in PATH (PathIndex keeps its own mtimes)
+    cmd = path.split()[0]
+    if os.path.dirname(cmd):
+        valid = which(cmd) is not None  # e.g. bin/tool, relative to cwd
+    else:
+        valid = _path_index.has(cmd)
+    return _Checked(valid, now, None, None)
 
 
 class Launcher:
@@ -0,0 +1,98 @@
+"""Search index for the launcher's find-as-you-type.
+
+Built once per tree version: every item's name pre-lowercased, its
+breadcrumb display name pre-formatted, and a trigram -> entries map so
+a query only has to look at names that could possibly contain it.
+
+Typing usually extends the last query, and a name containing "doom2"
+must also contain "doom" - so when the new query contains the previous
+one, the search narrows the previous results instead of starting over.
+
+fuzzy_search() is the ranked alternative (utils/fuzzy.py): letters in
+order rather than a contiguous substring, best matches first.
+"""
+
+from typing import Dict, List, Tuple
+
+from models import BaseItem, Folder
+from utils import fuzzy
+
+
+def _trigrams(text: str):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """Substring search over every item name in a tree.
+
+    Results come back as (display_name, item, path) in tree order - the
+    same order and shape the old recursive walk produced.
+    """
+
+    def __init__(self, tree: Dict[str, BaseItem]):
+        # Parallel lists, one slot per item. Results are pre-built
+        # (display_name, item, path) tuples; display_name carries the
+        # "(Folder > Sub)" breadcrumb and path lists are shared between
+        # siblings, so callers must not mutate them.
+        self.names: List[str] = []
+        self.results: List[Tuple[str, BaseItem, List[str]]] = []
+        self._trigrams: Dict[str, List[int]] = {}
+        # (query, matching ids) of the last search of each kind. One
+        # tuple each, so the server's threads always read a matching pair.
+        self._last = (None, [])
+        self._last_fuzzy = (None, [])
+        self._add_level(tree, [])
+
+    def _add_level(self, items: Dict[str, BaseItem], path: List[str]):
+        suffix = f" ({' > '.join(path)})" if path else ""
+        for name, item in items.items():
+            index = len(self.names)
+            name_lower = name.lower()
+            self.names.append(name_lower)
+            self.results.append((name + suffix, item, path))
+            for gram in _trigrams(name_lower):
+                self._trigrams.setdefault(gram, []).append(index)
+            if isinstance(item, Folder):
+                self._add_level(item.items, path + [name])
+
+    def _candidates(self, query: str) -> List[int]:
+        """Entry ids that might match, in tree order."""
+        last, last_ids = self._last
+        if last is not None and last in query:
+            return last_ids
+        if len(query) >= 3:
+            # Any one trigram's posting list is a superset of the matches;
+            # the rarest one is the cheapest to verify.
+            best = None
+            for gram in _trigrams(query):
+                postings = self._trigrams.get(gram)
+                if postings is None:
+                    return []
+                if best is None or len(postings) < len(best):
+                    best = postings
+            return best
+        return range(len(self.names))
+
+    def search(self, query: str) -> List[Tuple[str, BaseItem, List[str]]]:
+        """Items whose name contains query (case-insensitive)."""
+        query = query.lower()
+        names = self.names
+        ids = [i for i in self._candidates(query) if query in names[i]]
+        self._last = (query, ids)
+        results = self.results
+        return [results[i] for i in ids]
+
+    def fuzzy_ids(self, query: str, limit: int = 50) -> List[int]:
+        """Entry ids of the best `limit` fuzzy matches, best first."""
+        query = query.lower()
+        last, last_ids = self._last_fuzzy
+        # Appending letters only ever removes fuzzy matches
+        candidates = last_ids if last is not None and query.startswith(last) else None
+        ids = fuzzy.matching(query, self.names, candidates)
+        self._last_fuzzy = (query, ids)
+        return fuzzy.rank(query, self.names, ids, limit)
+
+    def fuzzy_search(self, query: str, limit: int = 50) -> List[Tuple[str, BaseItem, List[str]]]:
+        """Ranked fuzzy matches as (display_name, item, path), best first."""
+        results = self.results
+        return [results[i] for i in self.fuzzy_ids(query, limit)]
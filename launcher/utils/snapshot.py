@@ -0,0 +1,94 @@
+"""Compiled snapshot sidecar for shortcuts.json.
+
+Parsing a big shortcuts.json is most of the cold-start cost for every
+tool that reads it - the launcher, the server, mlmenu from a hotkey.
+The launcher therefore keeps shortcuts.snapshot next to it: the same
+dict, marshalled, stamped with the (mtime_ns, size) of the JSON it was
+made from. Readers use the snapshot only when that stamp still matches
+the JSON file, so hand edits to shortcuts.json always win.
+
+Format:
+    marshal.dumps((SNAPSHOT_MAGIC, (mtime_ns, size), data))
+
+The standalone tools in mlmenu/ and ml-extras-static/ load this file by
+path and call load_config(), so the format lives here and nowhere else.
+That's why it has no imports from the launcher beyond the logger, and
+makes do without that too.
+
+marshal, not pickle: loading it can't construct arbitrary objects.
+"""
+
+import json
+import marshal
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from utils.logger import logger
+except ImportError:  # loaded by file path from a standalone tool
+    import logging
+    logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = 'mlsnap1'
+
+
+def snapshot_path(json_path: Path) -> Path:
+    """shortcuts.json -> shortcuts.snapshot, in the same directory."""
+    return Path(json_path).with_suffix('.snapshot')
+
+
+def _stamp(json_path: Path) -> Tuple[int, int]:
+    st = os.stat(json_path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_snapshot(json_path: Path) -> Optional[Dict[str, Any]]:
+    """The snapshot's data if it matches json_path as it is now, else None."""
+    try:
+        stamp = _stamp(json_path)
+        with open(snapshot_path(json_path), 'rb') as f:
+            magic, snap_stamp, data = marshal.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable snapshot: {e}")
+        return None
+    if magic != SNAPSHOT_MAGIC or snap_stamp != stamp or not isinstance(data, dict):
+        return None
+    return data
+
+
+def write_snapshot(json_path: Path, data: Dict[str, Any],
+                   stamp: Optional[Tuple[int, int]] = None):
+    """Write the snapshot for json_path. Never raises - it's only a cache.
+
+    Pass the stamp taken *before* reading the JSON when there is one; a
+    file that changed mid-read then just leaves a stale snapshot."""
+    target = snapshot_path(json_path)
+    tmp = target.with_name(target.name + '.tmp')
+    try:
+        if stamp is None:
+            stamp = _stamp(json_path)
+        with open(tmp, 'wb') as f:
+            marshal.dump((SNAPSHOT_MAGIC, stamp, data), f)
+        os.replace(tmp, target)
+    except Exception as e:
+        logger.warning(f"Could not write snapshot {target}: {e}")
+
+
+def load_config(json_path: Path, refresh: bool = False) -> Dict[str, Any]:
+    """shortcuts.json's data, from the snapshot when it's current.
+
+    Falls back to parsing the JSON (raising what json.load/open raise).
+    refresh=True rewrites a stale snapshot after parsing - only the
+    launcher itself does that; the server stays read-only."""
+    data = load_snapshot(json_path)
+    if data is not None:
+        return data
+    stamp = _stamp(json_path)
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if refresh and isinstance(data, dict):
+        write_snapshot(json_path, data, stamp)
+    return data
@@ -0,0 +1,106 @@
+"""Flat id/path index over the shortcut tree.
+
+Both the native window and the web server need to turn "where is this
+item" into the item itself: the GUI from a list of folder names, the
+server from an encoded id like "Games/DOS%2FWin". Walking the tree one
+segment at a time (and unquoting every segment) makes that cost grow
+with depth; the index makes it one dict lookup.
+
+An index belongs to one version of the tree. Whoever owns the tree
+builds a fresh TreeIndex whenever the tree changes - it never tries to
+follow edits.
+"""
+
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+from urllib.parse import quote, unquote
+
+from models import BaseItem, Folder
+
+
+def encode_id(segments: Iterable[str]) -> str:
+    """Encode a list of item names into a URL-safe tree-path id.
+
+    Each segment is fully percent-encoded so names containing '/' can't
+    forge extra path levels."""
+    return '/'.join(quote(seg, safe='') for seg in segments)
+
+
+def decode_id(item_id: str) -> str:
+    """Turn an encoded tree-path id back into a readable path for display."""
+    return '/'.join(unquote(seg) for seg in item_id.split('/'))
+
+
+class Entry(NamedTuple):
+    """One indexed item: the item, the dict that holds it, and where it is."""
+    item: BaseItem
+    parent: Dict[str, BaseItem]
+    path: Tuple[str, ...]
+    id: str
+
+
+class TreeIndex:
+    """Lookup from path tuple or encoded id to an indexed Entry.
+
+    Levels are indexed lazily, a whole folder at a time, the first time
+    anything under them is asked for - opening one folder never pays
+    for the rest of the tree. After that every lookup is a single dict
+    hit. Concurrent readers (the server's request threads) may race to
+    index the same level; they write identical entries, so that's safe.
+    """
+
+    def __init__(self, tree: Dict[str, BaseItem]):
+        self.tree = tree
+        self._by_path: Dict[Tuple[str, ...], Entry] = {}
+        self._by_id: Dict[str, Entry] = {}
+        self._indexed = set()  # path tuples whose children are indexed
+        self._index_level((), '', tree)
+
+    def _index_level(self, path: Tuple[str, ...], prefix: str,
+                     items: Dict[str, BaseItem]):
+        for name, item in items.items():
+            child_path = path + (name,)
+            child_id = prefix + quote(name, safe='')
+            entry = Entry(item, items, child_path, child_id)
+            self._by_path[child_path] = entry
+            self._by_id[child_id] = entry
+        self._indexed.add(path)
+
+    def lookup(self, path: Iterable[str]) -> Optional[Entry]:
+        """The entry at a sequence of item names, or None."""
+        path = tuple(path)
+        if not path:
+            return None
+        entry = self._by_path.get(path)
+        if entry is not None or path[:-1] in self._indexed:
+            return entry
+        parent = self.lookup(path[:-1])
+        if parent is None or not isinstance(parent.item, Folder):
+            return None
+        self._index_level(parent.path, parent.id + '/', parent.item.items)
+        return self._by_path.get(path)
+
+    def resolve_id(self, item_id: str) -> Optional[Entry]:
+        """The entry for an encoded id, or None if it doesn't resolve.
+
+        Ids in canonical encoding (the ones encode_id produces) are a
+        single dict lookup; anything else is decoded and looked up by
+        path, so clients may encode differently."""
+        if not item_id:
+            return None
+        entry = self._by_id.get(item_id)
+        if entry is not None:
+            return entry
+        return self.lookup(unquote(seg) for seg in item_id.split('/'))
+
+    def container(self, path: Iterable[str]) -> Dict[str, BaseItem]:
+        """The items dict of the deepest folder along path.
+
+        Stops at the first segment that isn't a folder, so a stale path
+        degrades to its nearest surviving ancestor (or the top level)."""
+        path = tuple(path)
+        while path:
+            entry = self.lookup(path)
+            if entry is not None and isinstance(entry.item, Folder):
+                return entry.item.items
+            path = path[:-1]
+        return self.tree
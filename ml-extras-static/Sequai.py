@@ -6,6 +6,7 @@ Part of ML-Extras
 ONE JOB: Ask LLM to translate request to menu numbers
 """
 
+import importlib.util
 import json
 import sys
 import os
@@ -19,10 +20,33 @@ def check_shortcuts():
         sys.exit(1)
     return path
 
+def _load_snapshot():
+    """launcher/utils/snapshot.py from the checkout this file sits in,
+    loaded by file path (no sys.path changes); None if it isn't there."""
+    path = Path(__file__).resolve().parent.parent / 'launcher' / 'utils' / 'snapshot.py'
+    if not path.is_file():
+        return None
+    spec = importlib.util.spec_from_file_location('_ml_snapshot', path)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        return None
+    return module
+
+# Run outside a Magic-Launcher checkout, Sequai reads shortcuts.json as plain JSON.
+_snapshot = _load_snapshot()
+
+def load_shortcuts_data(config_file):
+    """Read shortcuts.json, via the launcher's compiled snapshot if current."""
+    if _snapshot is not None:
+        return _snapshot.load_config(Path(config_file))
+    with open(config_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 def shortcuts_to_menu(shortcuts_path):
     """Convert shortcuts.json to numbered menu"""
-    with open(shortcuts_path) as f:
-        data = json.load(f)
+    data = load_shortcuts_data(shortcuts_path)
     
     menu = []
     def add_items(items, depth=0):
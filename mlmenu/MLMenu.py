@@ -6,6 +6,7 @@ When even Tkinter is too heavy
 
 import os
 import sys
+import importlib.util
 import json
 import subprocess
 from pathlib import Path
@@ -27,6 +28,35 @@ except ImportError:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
         return key.lower()
 
+def _launcher_module(name):
+    """launcher/utils/<name>.py from the Magic-Launcher checkout this file
+    sits in, loaded by file path (no sys.path changes); None if absent."""
+    path = Path(__file__).resolve().parent.parent / 'launcher' / 'utils' / f'{name}.py'
+    spec = importlib.util.spec_from_file_location(f'_ml_launcher_{name}', path)
+    if spec is None or not path.is_file():
+        return None
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        return None
+    return module
+
+# Run outside a Magic-Launcher checkout, MLMenu reads shortcuts.json as plain JSON.
+_snapshot = _launcher_module('snapshot')
+
+# Ranked search borrows the launcher's fuzzy scorer when MLMenu sits in
+# a Magic-Launcher checkout; on its own it falls back to substrings.
+_fuzzy = _launcher_module('fuzzy')
+top_matches = _fuzzy.top_matches if _fuzzy is not None else None
+
+def load_shortcuts_data(config_file):
+    """Read shortcuts.json, via the launcher's compiled snapshot if current."""
+    if _snapshot is not None:
+        return _snapshot.load_config(Path(config_file))
+    with open(config_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 # Colors for terminals that support them
 class Colors:
     # Use simple ANSI codes that work on most terminals
@@ -51,10 +81,9 @@ class MLMenu:
         """Load shortcuts from Magic Launcher config"""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Convert to expected format
-                    self.shortcuts = self._convert_shortcuts(data)
+                data = load_shortcuts_data(self.config_file)
+                # Convert to expected format
+                self.shortcuts = self._convert_shortcuts(data)
             except Exception as e:
                 print(f"Error loading config: {e}")
                 self.shortcuts = self._get_demo_shortcuts()
@@ -120,6 +149,61 @@ class MLMenu:
                 return self.launch_item(item, wait=False)
         return False
     
+    def search(self, query, limit=9):
+        """Best matches for query across the whole tree, best first.
+
+        Returns (name, item, sequence) tuples, where sequence is the
+        number path that `mlmenu -c` takes to reach the item."""
+        flat = []
+        def walk(items, sequence):
+            for i, (name, item) in enumerate(items.items(), 1):
+                flat.append((name, item, sequence + [str(i)]))
+                if item.get("type") == "folder":
+                    walk(item.get("items", {}), sequence + [str(i)])
+        walk(self.shortcuts, [])
+
+        names = [name.lower() for name, _, _ in flat]
+        if top_matches is not None:
+            ranked = top_matches(query, names, limit)
+        else:
+            query = query.lower()
+            ranked = [i for i, name in enumerate(names) if query in name][:limit]
+        return [(flat[i][0], flat[i][1], ' '.join(flat[i][2])) for i in ranked]
+
+    def search_prompt(self):
+        """Interactive '/': type a query, pick a match by number"""
+        Colors.clear()
+        query = input("Search: ").strip()
+        if not query:
+            return
+        matches = self.search(query)
+        if not matches:
+            print("No matches. Press any key...")
+            get_key()
+            return
+        for i, (name, item, sequence) in enumerate(matches, 1):
+            label = f"[{name}]" if item.get("type") == "folder" else name
+            print(f"{Colors.YELLOW}[{i}]{Colors.RESET} {label[:40]:<40} ({sequence})")
+        print("\nSelect match (any other key to cancel): ", end='', flush=True)
+        key = get_key()
+        if key.isdigit() and 1 <= int(key) <= len(matches):
+            name, item, sequence = matches[int(key) - 1]
+            if item.get("type") == "folder":
+                self.current_path = self._path_for(sequence)
+                self.page = 0
+            else:
+                self.launch_item(item)
+
+    def _path_for(self, sequence):
+        """Folder names along a '-c' number sequence"""
+        path = []
+        items = self.shortcuts
+        for num in sequence.split():
+            name = list(items.keys())[int(num) - 1]
+            path.append(name)
+            items = items[name].get("items", {})
+        return path
+
     def draw_menu(self):
         """Draw the menu"""
         Colors.clear()
@@ -163,9 +247,9 @@ class MLMenu:
         if total_pages > 1:
             page_info = f"Page {self.page + 1}/{total_pages}"
             print(f"║ [Q]uit [B]ack [H]ome {page_info:>14}  ║")
-            print("║ [<,>] Page  [R]efresh                ║")
+            print("║ [<,>] Page  [R]efresh  [/] Find      ║")
         else:
-            print("║ [Q]uit  [B]ack  [H]ome  [R]efresh    ║")
+            print("║ [Q]uit [B]ack [H]ome [R]efresh [/]   ║")
         print(f"╚══════════════════════════════════════╝{Colors.RESET}")
         print("\nSelect option: ", end='', flush=True)
     
@@ -249,6 +333,8 @@ class MLMenu:
                 self.page = 0  # Reset to first page
             elif key == 'r':
                 self.load_shortcuts()
+            elif key == '/':
+                self.search_prompt()
             elif key == '.' or key == '>':  # Next page
                 items = self.get_current_items()
                 total_pages = (len(items) + 8) // 9
@@ -280,10 +366,18 @@ def main():
             menu = MLMenu()
             menu.run_commands(sys.argv[2])
             return
+        elif sys.argv[1] == '-s' and len(sys.argv) > 2:
+            # Ranked matches with the -c sequence that reaches each one
+            menu = MLMenu()
+            for name, item, sequence in menu.search(sys.argv[2]):
+                kind = "folder" if item.get("type") == "folder" else "shortcut"
+                print(f"{sequence:<12} {name} ({kind})")
+            return
         elif sys.argv[1] in ['-h', '--help']:
             print("MLMenu - Terminal launcher")
-            print("Usage: mlmenu [-c 'commands']")
+            print("Usage: mlmenu [-c 'commands' | -s 'query']")
             print("  -c '1 2 3'  Execute commands in sequence")
+            print("  -s 'query'  Find shortcuts, best match first, with their -c numbers")
             print("  -h          Show this help")
             return
     
@@ -30,15 +30,39 @@ Both read shortcuts.json, both use numbers, totally different purposes.
 One is a menu navigator, one is a workflow engine.
 """
 
+import importlib.util
 import json
 import subprocess
 import sys
 from pathlib import Path
 
+def _load_snapshot():
+    """launcher/utils/snapshot.py from the checkout this file sits in,
+    loaded by file path (no sys.path changes); None if it isn't there."""
+    path = Path(__file__).resolve().parent.parent / 'launcher' / 'utils' / 'snapshot.py'
+    if not path.is_file():
+        return None
+    spec = importlib.util.spec_from_file_location('_ml_snapshot', path)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        return None
+    return module
+
+# Run outside a Magic-Launcher checkout, MLRun reads shortcuts.json as plain JSON.
+_snapshot = _load_snapshot()
+
+def load_shortcuts_data(config_file):
+    """Read shortcuts.json, via the launcher's compiled snapshot if current."""
+    if _snapshot is not None:
+        return _snapshot.load_config(Path(config_file))
+    with open(config_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 def load_shortcuts():
     config_path = Path.home() / '.config/launcher/shortcuts.json'
-    with open(config_path) as f:
-        return json.load(f)
+    return load_shortcuts_data(config_path)
 
 def run_sequence(sequence, shortcuts):
     """Parse and run: 1 | 2 & 3 | 4"""